@@ -14,7 +14,8 @@ DB_CONFIG = {
     'user': os.getenv('DATABASE_USER'),  # Change this
     'password': os.getenv('DATABASE_PASSWORD'),  # Change this
     'database': os.getenv('DATABASE_NAME', 'nlu_system'),  # Change if needed
-    'port': int(os.getenv('DATABASE_PORT', 3306))
+    'port': int(os.getenv('DATABASE_PORT', 3306)),
+    'pool_size': int(os.getenv('DATABASE_POOL_SIZE', 4))  # Pooled connections (1 to 32)
 }
 
 # Module settings
@@ -4,19 +4,200 @@ Handles all database connections and operations
 """
 
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import (Error, DatabaseError, HAVE_CEXT, InterfaceError, NotSupportedError,
+                             PoolError, pooling)
+from collections import namedtuple
 from contextlib import contextmanager
-from typing import List, Dict, Any, Optional
+import functools
+from pathlib import Path
+import tempfile
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Sequence, Tuple
 import logging
+import threading
+import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tables reported by get_table_counts() and cleared by clear_analysis_data()
+COUNTED_TABLES = ('text_segments', 'sentences', 'tokens', 'morphemes', 'word_analysis')
+ANALYSIS_TABLES = ('text_segments', 'sentences', 'tokens', 'word_analysis')
+
+
+def _count_query(tables) -> str:
+    """Build a single SELECT returning the row count of each table as a column"""
+    subqueries = ', '.join(f"(SELECT COUNT(*) FROM {table}) AS {table}" for table in tables)
+    return f"SELECT {subqueries}"
+
+
+def _split_statements(script: str) -> Iterator[str]:
+    """
+    Yield the statements of a SQL script one at a time
+    
+    Splits on ';' only outside quoted strings, quoted identifiers and
+    comments. '--' and '#' comments and plain /* */ comments are replaced
+    by a space (so 'TABLE/*x*/t' stays two words); /*! */ and /*+ */
+    comments are kept, since the server acts on them.
+    """
+    pieces: List[str] = []
+    start = i = 0
+    n = len(script)
+    while i < n:
+        char = script[i]
+        if char in '\'"`':
+            # Skip to the closing quote; a doubled quote or (outside
+            # backticks) a backslash escape does not close it
+            i += 1
+            while i < n:
+                if script[i] == '\\' and char != '`':
+                    i += 2
+                elif script[i] == char:
+                    if script.startswith(char * 2, i):
+                        i += 2
+                    else:
+                        break
+                else:
+                    i += 1
+            i += 1
+        elif char == '#' or (script.startswith('--', i) and (i + 2 == n or script[i + 2].isspace())):
+            pieces.append(script[start:i])
+            pieces.append(' ')
+            end = script.find('\n', i)
+            i = start = n if end == -1 else end
+        elif script.startswith('/*', i):
+            end = script.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            if script.startswith(('/*!', '/*+'), i):
+                i = end
+            else:
+                pieces.append(script[start:i])
+                pieces.append(' ')
+                i = start = end
+        elif char == ';':
+            pieces.append(script[start:i])
+            statement = ''.join(pieces).strip()
+            if statement:
+                yield statement
+            pieces = []
+            i = start = i + 1
+        else:
+            i += 1
+    
+    pieces.append(script[start:])
+    statement = ''.join(pieces).strip()
+    if statement:
+        yield statement
+
+
+# Maximum rows sent in one multi-row INSERT statement
+INSERT_BATCH_SIZE = 1000
+
+# Columns insert_one()/insert_many() may write, per table (see database/schema.sql).
+# Table and column names are interpolated into SQL, so nothing else is accepted.
+INSERTABLE_COLUMNS: Dict[str, frozenset] = {
+    'morphemes': frozenset({'morpheme', 'type', 'meaning', 'language', 'frequency'}),
+    'word_analysis': frozenset({'word', 'root', 'prefix', 'suffix', 'pos_tag', 'lemma', 'language'}),
+    'text_segments': frozenset({'original_text', 'sentence_count', 'word_count'}),
+    'sentences': frozenset({'text_segment_id', 'sentence_text', 'sentence_position', 'word_count'}),
+    'tokens': frozenset({'sentence_id', 'token', 'token_position', 'is_punctuation', 'is_stopword'}),
+    'morphology_rules': frozenset({'rule_name', 'pattern', 'transformation', 'rule_type',
+                                   'priority', 'is_active'}),
+    'lexicon': frozenset({'word', 'pos', 'lemma', 'frequency', 'features', 'language'}),
+    'grammar_rules': frozenset({'lhs', 'rhs', 'probability', 'grammar_name', 'is_active'}),
+    'parse_results': frozenset({'sentence', 'parse_tree', 'parser_type', 'parse_time_ms'}),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _insert_parts(table: str, columns: Tuple[str, ...]) -> Tuple[str, str]:
+    """
+    Check (once) a table and column tuple, and build the INSERT prefix and
+    one row's placeholders for them
+    
+    Raises:
+        ValueError: If the table or a column is not in INSERTABLE_COLUMNS
+    """
+    allowed = INSERTABLE_COLUMNS.get(table)
+    if allowed is None:
+        raise ValueError(f"Inserts into table {table!r} are not allowed")
+    unknown = [column for column in columns if column not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown columns for table {table!r}: {', '.join(unknown)}")
+    
+    return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ",
+            '(' + ', '.join(['%s'] * len(columns)) + ')')
+
+
+def _insert_sql(table: str, columns: Tuple[str, ...], rows: int = 1) -> str:
+    """
+    Build the INSERT statement for a table, column tuple and row count
+    
+    Only the parts are cached (per table and columns), so the varying row
+    counts of trailing partial batches don't push other entries out.
+    
+    Raises:
+        ValueError: If the table or a column is not in INSERTABLE_COLUMNS
+    """
+    prefix, row_placeholders = _insert_parts(table, columns)
+    return prefix + ', '.join([row_placeholders] * rows)
+
+
+def _tsv_field(value: Any) -> str:
+    """Render one value for LOAD DATA's default tab-separated format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        value = int(value)
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+# Seconds a cached read stays valid if no write invalidates it first
+CACHE_TTL = 30.0
+
+_TABLE_COUNTS_QUERY = _count_query(COUNTED_TABLES)
+
+# The counter is only kept current by its two triggers, which the schema
+# load skips without the TRIGGER privilege; without them it is not used
+_MORPHEME_COUNTER_QUERY = """
+    SELECT row_count FROM meta_counters
+    WHERE table_name = 'morphemes'
+      AND (SELECT COUNT(*) FROM information_schema.TRIGGERS
+           WHERE TRIGGER_SCHEMA = DATABASE() AND EVENT_OBJECT_TABLE = 'morphemes'
+             AND TRIGGER_NAME IN ('morphemes_after_insert', 'morphemes_after_delete')) = 2
+"""
+_ANALYSIS_COUNTS_QUERY = _count_query(ANALYSIS_TABLES)
+
+# Row types built by fetch_rows(), keyed by the result's column names
+_ROW_TYPES: Dict[Tuple[str, ...], type] = {}
+
+
+def _row_type(columns: Tuple[str, ...]) -> type:
+    """
+    Return the namedtuple type for a result with the given columns
+    
+    Columns that aren't valid, unique field names (COUNT(*), a second id)
+    are named by position instead: _0, _1, ...
+    """
+    row_type = _ROW_TYPES.get(columns)
+    if row_type is None:
+        row_type = _ROW_TYPES[columns] = namedtuple('Row', columns, rename=True)
+    return row_type
+
+
+def _named_rows(cursor, rows: List[tuple]) -> List[tuple]:
+    """Wrap a tuple cursor's rows in the named tuple type for its columns"""
+    columns = tuple(column[0] for column in cursor.description or ())
+    return list(map(_row_type(columns)._make, rows))
+
 
 class DatabaseManager:
     """Manages MySQL database connections and operations"""
     
-    def __init__(self, host: str, user: str, password: str, database: str, port: int = 3306):
+    # Schema scripts already read, shared by all managers in the process:
+    # resolved path -> (mtime_ns, script text)
+    _schema_cache: Dict[str, Tuple[int, str]] = {}
+    
+    def __init__(self, host: str, user: str, password: str, database: str, port: int = 3306,
+                 pool_size: int = 4):
         """
         Initialize database manager
         
@@ -26,55 +207,194 @@ class DatabaseManager:
             password: Database password
             database: Database name
             port: Database port (default 3306)
+            pool_size: Number of pooled connections (default 4); values
+                outside 1..32 are clamped to that range
         """
         self.config = {
             'host': host,
             'user': user,
             'password': password,
             'database': database,
-            'port': port
+            'port': port,
+            # Use the C extension for protocol parsing when it is built
+            'use_pure': not HAVE_CEXT,
+            # Never let the server read client files through LOAD DATA LOCAL
+            'allow_local_infile': False,
+            # Each statement commits on its own; multi-statement writes
+            # open an explicit transaction (see get_cursor, transaction)
+            'autocommit': True
         }
-        self._connection = None
+        # MySQLConnectionPool only accepts 1..CNX_POOL_MAXSIZE connections
+        self.pool_size = min(max(pool_size, 1), pooling.CNX_POOL_MAXSIZE)
+        if self.pool_size != pool_size:
+            logger.warning(f"pool_size {pool_size} is out of range, using {self.pool_size}")
+        self._pool = None
+        
+        # (method, args) -> (expires_at or None, tables read, value)
+        self._cache: Dict[tuple, Tuple[Optional[float], Tuple[str, ...], Any]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # ID of the last sentence inserted through this manager
+        self._last_sentence_id: Optional[int] = None
+        
+        # Per-thread state: the connection of an open transaction() block
+        self._local = threading.local()
+        
+        # Server's auto_increment_increment, and whether a multi-row INSERT
+        # gets consecutive IDs (innodb_autoinc_lock_mode 0 or 1), read on first use
+        self._auto_increment_step: Optional[int] = None
+        self._consecutive_insert_ids: Optional[bool] = None
     
     def connect(self) -> bool:
-        """Establish database connection"""
-        try:
-            self._connection = mysql.connector.connect(**self.config)
-            if self._connection.is_connected():
-                logger.info("Successfully connected to MySQL database")
+        """
+        Open the connection pool
+        
+        If the pool is already open this only checks that a connection can
+        be taken from it.
+        
+        Returns:
+            True if the database is reachable
+        """
+        if self._pool:
+            try:
+                self._pool.get_connection().close()
                 return True
-            return False
+            except Error as e:
+                logger.error(f"Connection pool health check failed: {e}")
+                return False
+        
+        try:
+            # Opens pool_size connections up front; each one is returned
+            # with its session reset so no state leaks between callers
+            self._pool = pooling.MySQLConnectionPool(
+                pool_name="nlu",
+                pool_size=self.pool_size,
+                pool_reset_session=True,
+                **self.config
+            )
+            logger.info("Successfully connected to MySQL database "
+                        f"({'pure Python' if self.config['use_pure'] else 'C extension'} driver)")
+            return True
         except Error as e:
             logger.error(f"Error connecting to MySQL: {e}")
+            self._pool = None
             return False
     
     def disconnect(self):
-        """Close database connection"""
-        if self._connection and self._connection.is_connected():
-            self._connection.close()
+        """Close all pooled connections"""
+        if self._pool:
+            pool, self._pool = self._pool, None
+            # Check every idle connection out and disconnect it (a pooled
+            # connection passes disconnect() through to the real one).
+            # Connections still checked out close when they are dropped.
+            while True:
+                try:
+                    connection = pool.get_connection()
+                except PoolError:
+                    break  # No idle connections left
+                except Error as e:
+                    logger.warning(f"Could not close a pooled connection: {e}")
+                    break
+                connection.disconnect()
             logger.info("MySQL connection closed")
     
+    def __enter__(self):
+        """Open the connection pool for the duration of a with block"""
+        if not self.connect():
+            raise ConnectionError("Failed to connect to database")
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the connection pool"""
+        self.disconnect()
+    
     @contextmanager
-    def get_cursor(self, dictionary=True):
+    def get_cursor(self, dictionary=True, transactional=False):
         """
         Context manager for database cursor
         
+        Checks a connection out of the pool for the duration of the block
+        and returns it to the pool afterwards. Connections run in autocommit
+        mode, so reads and single-statement writes cost no extra COMMIT.
+        Inside a transaction() block the transaction's connection is used
+        and nothing is committed here.
+        
         Args:
             dictionary: Return results as dictionaries (default True)
+            transactional: Run the block's statements as one transaction,
+                committed on exit or rolled back if it raises
         """
-        if not self._connection or not self._connection.is_connected():
+        transaction_connection = self._transaction_connection()
+        if transaction_connection is not None:
+            cursor = transaction_connection.cursor(dictionary=dictionary)
+            try:
+                yield cursor
+            except Error as e:
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                cursor.close()
+            return
+        
+        if not self._pool:
             raise Error("Database connection not established. Call connect() first.")
         
-        cursor = self._connection.cursor(dictionary=dictionary)
+        connection = self._pool.get_connection()
+        cursor = connection.cursor(dictionary=dictionary)
         try:
+            if transactional:
+                connection.start_transaction()
             yield cursor
-            self._connection.commit()
+            if transactional:
+                connection.commit()
         except Error as e:
-            self._connection.rollback()
+            if transactional:
+                connection.rollback()
             logger.error(f"Database error: {e}")
             raise
         finally:
             cursor.close()
+            connection.close()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Run everything in the block as a single transaction
+        
+        All statements issued from this thread inside the block share one
+        pooled connection and are committed once on exit, or rolled back if
+        the block raises. A nested transaction() joins the outer one.
+        
+        Inside the block the write methods raise database errors instead of
+        logging them and returning a failure, so one failed write rolls the
+        whole block back rather than committing the writes around it.
+        """
+        if self._transaction_connection() is not None:
+            yield
+            return
+        
+        if not self._pool:
+            raise Error("Database connection not established. Call connect() first.")
+        
+        connection = self._pool.get_connection()
+        self._local.connection = connection
+        try:
+            connection.start_transaction()
+            yield
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            self._last_sentence_id = None
+            # Reads cached inside the block may show rolled-back rows
+            self.invalidate()
+            raise
+        finally:
+            self._local.connection = None
+            connection.close()
+    
+    def _transaction_connection(self):
+        """Return the connection of this thread's open transaction() block, or None"""
+        return getattr(self._local, 'connection', None)
     
     def execute_query(self, query: str, params: Optional[tuple] = None) -> bool:
         """
@@ -86,13 +406,21 @@ class DatabaseManager:
         
         Returns:
             Success status
+        
+        Raises:
+            Error: On a database error inside a transaction()
         """
+        if not query.lstrip().upper().startswith('SELECT'):
+            self.invalidate()
+        
         try:
             with self.get_cursor() as cursor:
                 cursor.execute(query, params or ())
                 return True
         except Error as e:
             logger.error(f"Query execution failed: {e}")
+            if self._transaction_connection() is not None:
+                raise
             return False
     
     def fetch_one(self, query: str, params: Optional[tuple] = None) -> Optional[Dict[str, Any]]:
@@ -115,6 +443,38 @@ class DatabaseManager:
             logger.error(f"Fetch one failed: {e}")
             return None
     
+    def iter_all(self, query: str, params: Optional[tuple] = None,
+                 chunk: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over results without materializing the whole result set
+        
+        Rows are read from the server in chunks, so memory stays bounded
+        by the chunk size. The connection is held until the iterator is
+        exhausted or closed.
+        
+        Args:
+            query: SQL query
+            params: Query parameters
+            chunk: Rows fetched per round trip (default 1000)
+        
+        Yields:
+            Results as dictionaries
+        """
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params or ())
+            try:
+                while True:
+                    rows = cursor.fetchmany(chunk)
+                    if not rows:
+                        break
+                    yield from rows  # type: ignore[misc]
+            except GeneratorExit:
+                # Consumer stopped early; read off the rest so the connection
+                # goes back to the pool without an unread result
+                while cursor.fetchmany(chunk):
+                    pass
+                raise
+    
     def fetch_all(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
         """
         Fetch all results
@@ -127,13 +487,38 @@ class DatabaseManager:
             List of results as dictionaries
         """
         try:
-            with self.get_cursor() as cursor:
-                cursor.execute(query, params or ())
-                return cursor.fetchall()  # type: ignore[return-value]
+            return list(self.iter_all(query, params))
         except Error as e:
             logger.error(f"Fetch all failed: {e}")
             return []
     
+    def fetch_rows(self, query: str, params: Optional[tuple] = None) -> List[tuple]:
+        """
+        Fetch all results as named tuples
+        
+        Cheaper than fetch_all() for fixed-column queries, since rows come
+        from a tuple cursor and are only wrapped, not copied into dicts.
+        
+        Args:
+            query: SQL query
+            params: Query parameters
+        
+        Returns:
+            List of results as named tuples (fields are the column names,
+            see _row_type)
+        """
+        try:
+            return self._fetch_rows(query, params)
+        except Error as e:
+            logger.error(f"Fetch rows failed: {e}")
+            return []
+    
+    def _fetch_rows(self, query: str, params: Optional[tuple] = None) -> List[tuple]:
+        """fetch_rows() that raises database errors instead of returning []"""
+        with self.get_cursor(dictionary=False) as cursor:
+            cursor.execute(query, params or ())
+            return _named_rows(cursor, cursor.fetchall())
+    
     def insert_one(self, table: str, data: Dict[str, Any]) -> Optional[int]:
         """
         Insert single record
@@ -144,68 +529,362 @@ class DatabaseManager:
         
         Returns:
             Last insert ID or None
+        
+        Raises:
+            ValueError: If the table or a column is not in INSERTABLE_COLUMNS
+            Error: On a database error inside a transaction()
         """
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['%s'] * len(data))
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        query = _insert_sql(table, tuple(data))
+        self.invalidate(table)
         
         try:
             with self.get_cursor() as cursor:
                 cursor.execute(query, tuple(data.values()))
+                if table == 'sentences':
+                    self._last_sentence_id = cursor.lastrowid
                 return cursor.lastrowid
         except Error as e:
             logger.error(f"Insert failed: {e}")
+            if self._transaction_connection() is not None:
+                raise
             return None
     
-    def insert_many(self, table: str, data_list: List[Dict[str, Any]]) -> bool:
+    def insert_many(self, table: str, data_list: List[Dict[str, Any]],
+                    chunk_size: int = INSERT_BATCH_SIZE) -> bool:
         """
         Insert multiple records
         
+        Rows go out as multi-row INSERT ... VALUES (...), (...) statements
+        of up to chunk_size rows, so N rows cost N / chunk_size round trips.
+        
         Args:
             table: Table name
             data_list: List of dictionaries with column:value pairs
+            chunk_size: Maximum rows per statement (keep the statement
+                under the server's max_allowed_packet)
         
         Returns:
             Success status
+        
+        Raises:
+            ValueError: If the table or a column is not in INSERTABLE_COLUMNS
+            Error: On a database error inside a transaction()
         """
         if not data_list:
             return False
         
-        columns = ', '.join(data_list[0].keys())
-        placeholders = ', '.join(['%s'] * len(data_list[0]))
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        first_keys = data_list[0].keys()
+        if all(data.keys() == first_keys for data in data_list):
+            runs = [(tuple(first_keys), data_list)]
+        else:
+            # Rows don't share one column set: each run of consecutive rows
+            # with the same columns gets its own statements
+            runs = []
+            for data in data_list:
+                columns = tuple(data)
+                if runs and runs[-1][0] == columns:
+                    runs[-1][1].append(data)
+                else:
+                    runs.append((columns, [data]))
+        
+        for columns, _ in runs:
+            _insert_sql(table, columns)
+        self.invalidate(table)
         
         try:
-            with self.get_cursor() as cursor:
-                values = [tuple(data.values()) for data in data_list]
-                cursor.executemany(query, values)
+            with self.get_cursor(transactional=True) as cursor:
+                for columns, rows in runs:
+                    for start in range(0, len(rows), chunk_size):
+                        batch = rows[start:start + chunk_size]
+                        query = _insert_sql(table, columns, len(batch))
+                        cursor.execute(query, [data[column] for data in batch for column in columns])
                 return True
         except Error as e:
             logger.error(f"Bulk insert failed: {e}")
+            if self._transaction_connection() is not None:
+                raise
+            return False
+    
+    def insert_many_returning_ids(self, table: str, data_list: List[Dict[str, Any]],
+                                  chunk_size: int = INSERT_BATCH_SIZE) -> Optional[List[int]]:
+        """
+        Insert multiple records and return their IDs
+        
+        Like insert_many(), but all rows must have the same columns. With
+        innodb_autoinc_lock_mode 0 or 1, InnoDB reserves the AUTO_INCREMENT
+        values of a multi-row INSERT with a known row count in one go, so they
+        are consecutive (spaced by auto_increment_increment) and follow from
+        the statement's first ID. In mode 2 (interleaved, the MySQL 8 default)
+        concurrent inserts can take values in between, so the rows are then
+        inserted one at a time, each reporting its own ID.
+        
+        Args:
+            table: Table name
+            data_list: List of dictionaries with column:value pairs
+            chunk_size: Maximum rows per statement
+        
+        Returns:
+            Insert IDs in the order of data_list, or None if the insert failed
+        
+        Raises:
+            ValueError: If the table or a column is not in INSERTABLE_COLUMNS,
+                or the rows don't all have the same columns
+            Error: On a database error inside a transaction()
+        """
+        if not data_list:
+            return []
+        
+        first_keys = data_list[0].keys()
+        if not all(data.keys() == first_keys for data in data_list):
+            raise ValueError("All rows must have the same columns")
+        columns = tuple(first_keys)
+        _insert_sql(table, columns)
+        self.invalidate(table)
+        
+        ids: List[int] = []
+        try:
+            with self.get_cursor(dictionary=False, transactional=True) as cursor:
+                step = self._auto_increment_step
+                if step is None:
+                    cursor.execute("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode")
+                    step, lock_mode = cursor.fetchone()  # type: ignore[misc]
+                    step = self._auto_increment_step = int(step)
+                    self._consecutive_insert_ids = int(lock_mode) in (0, 1)
+                
+                if self._consecutive_insert_ids:
+                    for start in range(0, len(data_list), chunk_size):
+                        batch = data_list[start:start + chunk_size]
+                        query = _insert_sql(table, columns, len(batch))
+                        cursor.execute(query, [data[column] for data in batch for column in columns])
+                        first_id = cursor.lastrowid
+                        ids.extend(range(first_id, first_id + len(batch) * step, step))
+                else:
+                    query = _insert_sql(table, columns)
+                    for data in data_list:
+                        cursor.execute(query, [data[column] for column in columns])
+                        ids.append(cursor.lastrowid)
+        except Error as e:
+            logger.error(f"Bulk insert failed: {e}")
+            if self._transaction_connection() is not None:
+                raise
+            return None
+        
+        if table == 'sentences':
+            self._last_sentence_id = ids[-1]
+        return ids
+    
+    def bulk_load(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> bool:
+        """
+        Load many rows with LOAD DATA LOCAL INFILE
+        
+        The rows are written to a temporary tab-separated file and streamed
+        over a separate connection that may only read files from that
+        file's directory. Falls back to insert_many() inside a transaction()
+        (the load could not see or join it), if the temporary file cannot be
+        written, if the server refuses the load, or if the load gives any
+        warnings (it is rolled back then, and insert_many() reports the bad
+        rows as errors where the server is in strict mode).
+        
+        Args:
+            table: Table name
+            columns: Column names, in the order of the values in each row
+            rows: Row value sequences
+        
+        Returns:
+            Success status
+        
+        Raises:
+            ValueError: If the table or a column is not in INSERTABLE_COLUMNS
+            Error: On a database error inside a transaction()
+        """
+        columns = tuple(columns)
+        rows = list(rows)
+        _insert_sql(table, columns)
+        if not rows:
+            return False
+        
+        if self._transaction_connection() is not None:
+            return self.insert_many(table, [dict(zip(columns, row)) for row in rows])
+        if not self._pool:
+            logger.error("Bulk load failed: Database connection not established. Call connect() first.")
             return False
+        
+        self.invalidate(table)
+        try:
+            with tempfile.TemporaryDirectory(prefix='nlu_load_') as load_dir:
+                path = Path(load_dir) / f'{table}.tsv'
+                with open(path, 'w', encoding='utf-8', newline='\n') as f:
+                    for row in rows:
+                        f.write('\t'.join(_tsv_field(value) for value in row) + '\n')
+                
+                connection = mysql.connector.connect(**self.config, allow_local_infile_in_path=load_dir)
+                try:
+                    cursor = connection.cursor()
+                    # A LOCAL load turns bad values into warnings instead of
+                    # errors, so load in a transaction and keep only a clean load
+                    connection.start_transaction()
+                    cursor.execute(
+                        f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+                        f"CHARACTER SET utf8mb4 ({', '.join(columns)})",
+                        (path.as_posix(),)
+                    )
+                    warning_count = cursor.warning_count
+                    if warning_count:
+                        cursor.execute("SHOW WARNINGS LIMIT 1")
+                        first_warning = cursor.fetchone()
+                        connection.rollback()
+                    else:
+                        connection.commit()
+                    cursor.close()
+                finally:
+                    connection.close()
+            if not warning_count:
+                logger.info(f"Bulk loaded {len(rows)} rows into {table}")
+                return True
+            reason = f"{warning_count} warnings, first: {first_warning[2] if first_warning else 'unknown'}"
+        except (Error, OSError) as e:
+            # Typically local_infile disabled on the server, or no room for the temporary file
+            reason = str(e)
+        
+        logger.warning(f"Bulk load into {table} failed ({reason}), using multi-row INSERT")
+        return self.insert_many(table, [dict(zip(columns, row)) for row in rows])
     
     def initialize_database(self, schema_file: str):
         """
         Initialize database with schema file
         
+        A statement that fails (e.g. CREATE TRIGGER without the TRIGGER
+        privilege) is logged and skipped; the statements after it still run.
+        
         Args:
             schema_file: Path to SQL schema file
         """
+        self.invalidate()
+        
         try:
-            with open(schema_file, 'r') as f:
-                schema = f.read()
+            schema = self._read_schema(schema_file)
+            statements = list(_split_statements(schema))
             
-            # Split and execute statements
-            statements = schema.split(';')
-            for statement in statements:
-                statement = statement.strip()
-                if statement:
-                    self.execute_query(statement)
+            # Send the whole script at once; the server splits it into
+            # statements, so semicolons inside literals or comments are safe.
+            # Every result set has to be consumed for all statements to run,
+            # and each one that is consumed is a statement that succeeded.
+            succeeded = 0
+            failed = 0
+            try:
+                with self.get_cursor(dictionary=False) as cursor:
+                    cursor.execute(schema)
+                    succeeded = 1
+                    while cursor.nextset():
+                        succeeded += 1
+            except (InterfaceError, NotSupportedError) as e:
+                # Driver or server refused a multi-statement string
+                logger.warning(f"Multi-statement schema load rejected ({e}), "
+                               "running statements one by one")
+                failed = self._run_statements(statements)
+            except DatabaseError as e:
+                # The server stops at the first failing statement; the ones
+                # before it have run, the rest are sent one by one
+                statement = statements[succeeded] if succeeded < len(statements) else ''
+                self._log_failed_statement(succeeded, statement, e)
+                failed = 1 + self._run_statements(statements[succeeded + 1:], succeeded + 1)
             
-            logger.info("Database initialized successfully")
+            if failed:
+                logger.warning(f"Database initialized, {failed} of {len(statements)} statements failed")
+            else:
+                logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
     
+    def _run_statements(self, statements: List[str], offset: int = 0) -> int:
+        """
+        Execute statements one by one, logging and skipping the ones that fail
+        
+        Args:
+            statements: SQL statements
+            offset: Index of the first statement in the script (for the log)
+        
+        Returns:
+            Number of failed statements
+        """
+        failed = 0
+        with self.get_cursor(dictionary=False) as cursor:
+            for index, statement in enumerate(statements, offset):
+                try:
+                    cursor.execute(statement)
+                    if cursor.with_rows:
+                        cursor.fetchall()
+                except Error as e:
+                    self._log_failed_statement(index, statement, e)
+                    failed += 1
+        return failed
+    
+    @staticmethod
+    def _log_failed_statement(index: int, statement: str, error: Error):
+        """Log a failed schema statement by its 1-based position and first line"""
+        first_line = statement.splitlines()[0] if statement else ''
+        logger.error(f"Schema statement {index + 1} failed ({error}): {first_line}")
+    
+    @classmethod
+    def _read_schema(cls, schema_file: str) -> str:
+        """Return the schema script, rereading the file only when it changed"""
+        path = Path(schema_file).resolve()
+        mtime_ns = path.stat().st_mtime_ns
+        cached = cls._schema_cache.get(str(path))
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        schema = path.read_text(encoding='utf-8')
+        cls._schema_cache[str(path)] = (mtime_ns, schema)
+        return schema
+    
+    # ====================
+    # Read Cache
+    # ====================
+    
+    def _cached(self, key: tuple, tables: Tuple[str, ...], loader: Callable[[], Any],
+                ttl: Optional[float] = CACHE_TTL, default: Any = None) -> Any:
+        """
+        Return a cached read result, calling loader() on a miss
+        
+        Args:
+            key: Cache key, usually (method name, arguments)
+            tables: Tables the result is read from
+            loader: Callable producing the value; raises Error if the read fails
+            ttl: Seconds until the entry expires (None keeps it until invalidated)
+            default: Returned (and not cached) when loader() fails
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and (entry[0] is None or entry[0] > now):
+            return entry[2]
+        
+        try:
+            value = loader()
+        except Error as e:
+            logger.error(f"Read for {key[0]} failed: {e}")
+            return default
+        
+        with self._cache_lock:
+            self._cache[key] = (None if ttl is None else now + ttl, tables, value)
+        return value
+    
+    def invalidate(self, table: Optional[str] = None):
+        """
+        Drop cached read results
+        
+        Args:
+            table: Only drop results read from this table (None drops all)
+        """
+        with self._cache_lock:
+            if table is None:
+                self._cache.clear()
+                return
+            
+            for key in [k for k, entry in self._cache.items() if table in entry[1]]:
+                del self._cache[key]
+    
     # ====================
     # Statistics Methods
     # ====================
@@ -217,16 +896,10 @@ class DatabaseManager:
         Returns:
             Dictionary with table names and their counts
         """
-        counts = {}
-        tables = ['text_segments', 'sentences', 'tokens', 'morphemes', 'word_analysis']
-        
-        for table in tables:
-            result = self.fetch_one(f"SELECT COUNT(*) as count FROM {table}")
-            counts[table] = result['count'] if result else 0
-        
-        return counts
+        result = self.fetch_one(_TABLE_COUNTS_QUERY)
+        return {table: result[table] if result else 0 for table in COUNTED_TABLES}
     
-    def get_recent_text_segments(self, limit: int = 5) -> List[Dict[str, Any]]:
+    def get_recent_text_segments(self, limit: int = 5) -> List[tuple]:
         """
         Get recent text segments
         
@@ -234,7 +907,7 @@ class DatabaseManager:
             limit: Number of records to retrieve
         
         Returns:
-            List of text segment records
+            List of text segment records as named tuples
         """
         query = """
             SELECT id, LEFT(original_text, 50) as text_preview, 
@@ -243,9 +916,12 @@ class DatabaseManager:
             ORDER BY processed_at DESC 
             LIMIT %s
         """
-        return self.fetch_all(query, (limit,))
+        return self._cached(
+            ('get_recent_text_segments', limit), ('text_segments',),
+            lambda: self._fetch_rows(query, (limit,)), default=[]
+        )
     
-    def get_recent_sentences(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_sentences(self, limit: int = 10) -> List[tuple]:
         """
         Get recent sentences
         
@@ -253,7 +929,7 @@ class DatabaseManager:
             limit: Number of records to retrieve
         
         Returns:
-            List of sentence records
+            List of sentence records as named tuples
         """
         query = """
             SELECT id, LEFT(sentence_text, 50) as text, 
@@ -262,21 +938,27 @@ class DatabaseManager:
             ORDER BY id DESC 
             LIMIT %s
         """
-        return self.fetch_all(query, (limit,))
+        return self._cached(
+            ('get_recent_sentences', limit), ('sentences',),
+            lambda: self._fetch_rows(query, (limit,)), default=[]
+        )
     
-    def get_tokens_by_sentence(self, sentence_id: Optional[int] = None, limit: int = 15) -> List[Dict[str, Any]]:
+    def get_tokens_by_sentence(self, sentence_id: Optional[int] = None, limit: int = 15) -> List[tuple]:
         """
         Get tokens from a specific sentence or the most recent one
         
         Args:
-            sentence_id: Specific sentence ID (None for most recent)
+            sentence_id: Specific sentence ID (None for the most recently inserted one)
             limit: Number of tokens to retrieve
         
         Returns:
-            List of token records
+            List of token records as named tuples
         """
         if sentence_id is None:
-            # Get most recent sentence
+            sentence_id = self._last_sentence_id
+        
+        if sentence_id is None:
+            # Nothing inserted through this manager yet, look up the most recent sentence
             query = """
                 SELECT token, token_position, is_punctuation, is_stopword
                 FROM tokens
@@ -284,19 +966,18 @@ class DatabaseManager:
                 ORDER BY token_position
                 LIMIT %s
             """
-        else:
-            query = """
-                SELECT token, token_position, is_punctuation, is_stopword
-                FROM tokens
-                WHERE sentence_id = %s
-                ORDER BY token_position
-                LIMIT %s
-            """
-            return self.fetch_all(query, (sentence_id, limit))
+            return self.fetch_rows(query, (limit,))
         
-        return self.fetch_all(query, (limit,))
+        query = """
+            SELECT token, token_position, is_punctuation, is_stopword
+            FROM tokens
+            WHERE sentence_id = %s
+            ORDER BY token_position
+            LIMIT %s
+        """
+        return self.fetch_rows(query, (sentence_id, limit))
     
-    def get_recent_word_analyses(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_word_analyses(self, limit: int = 10) -> List[tuple]:
         """
         Get recent word analyses
         
@@ -304,7 +985,7 @@ class DatabaseManager:
             limit: Number of records to retrieve
         
         Returns:
-            List of word analysis records
+            List of word analysis records as named tuples
         """
         query = """
             SELECT word, root, prefix, suffix, pos_tag, lemma
@@ -312,7 +993,10 @@ class DatabaseManager:
             ORDER BY id DESC
             LIMIT %s
         """
-        return self.fetch_all(query, (limit,))
+        return self._cached(
+            ('get_recent_word_analyses', limit), ('word_analysis',),
+            lambda: self._fetch_rows(query, (limit,)), default=[]
+        )
     
     # ====================
     # Clear/Delete Methods
@@ -331,26 +1015,27 @@ class DatabaseManager:
             'error': None
         }
         
+        for table in ANALYSIS_TABLES:
+            self.invalidate(table)
+        self._last_sentence_id = None
+        
         try:
             with self.get_cursor(dictionary=True) as cursor:
                 # Get counts before deletion
-                tables = ['text_segments', 'sentences', 'tokens', 'word_analysis']
-                for table in tables:
-                    cursor.execute(f"SELECT COUNT(*) as count FROM {table}")
-                    row = cursor.fetchone()
-                    result['deleted_counts'][table] = row['count'] if row else 0  # type: ignore[index]
-                
-                # Delete in correct order (respecting foreign key constraints)
-                cursor.execute("DELETE FROM tokens")
-                cursor.execute("DELETE FROM word_analysis")
-                cursor.execute("DELETE FROM sentences")
-                cursor.execute("DELETE FROM text_segments")
+                cursor.execute(_ANALYSIS_COUNTS_QUERY)
+                row = cursor.fetchone()
+                for table in ANALYSIS_TABLES:
+                    result['deleted_counts'][table] = row[table] if row else 0  # type: ignore[index]
                 
-                # Reset auto-increment counters
-                cursor.execute("ALTER TABLE tokens AUTO_INCREMENT = 1")
-                cursor.execute("ALTER TABLE word_analysis AUTO_INCREMENT = 1")
-                cursor.execute("ALTER TABLE sentences AUTO_INCREMENT = 1")
-                cursor.execute("ALTER TABLE text_segments AUTO_INCREMENT = 1")
+                # TRUNCATE drops and recreates each table, which also resets
+                # its AUTO_INCREMENT counter. Foreign key checks must be off
+                # for it to run on tables referenced by another table.
+                cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+                try:
+                    for table in ('tokens', 'word_analysis', 'sentences', 'text_segments'):
+                        cursor.execute(f"TRUNCATE TABLE {table}")
+                finally:
+                    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
                 
                 result['success'] = True
                 logger.info("Analysis data cleared successfully")
@@ -358,8 +1043,6 @@ class DatabaseManager:
         except Error as e:
             result['error'] = str(e)
             logger.error(f"Error clearing analysis data: {e}")
-            if self._connection:
-                self._connection.rollback()
         
         return result
     
@@ -370,5 +1053,15 @@ class DatabaseManager:
         Returns:
             Number of morphemes
         """
-        result = self.fetch_one("SELECT COUNT(*) as count FROM morphemes")
-        return result['count'] if result else 0
\ No newline at end of file
+        def load():
+            # Trigger-maintained counter instead of scanning the table
+            result = self.fetch_one(_MORPHEME_COUNTER_QUERY)
+            if result:
+                return result['row_count']
+            
+            # Schema predates meta_counters, or the triggers are missing;
+            # a failure here is raised so it isn't cached
+            return self._fetch_rows("SELECT COUNT(*) AS row_count FROM morphemes")[0].row_count
+        
+        # Only changes when the morpheme dictionary is written
+        return self._cached(('get_morpheme_count',), ('morphemes',), load, ttl=None, default=0)
\ No newline at end of file
@@ -14,6 +14,24 @@ CREATE TABLE IF NOT EXISTS morphemes (
     INDEX idx_type (type)
 );
 
+-- Row counts maintained by triggers, so counting needs no table scan
+CREATE TABLE IF NOT EXISTS meta_counters (
+    table_name VARCHAR(64) PRIMARY KEY,
+    row_count BIGINT NOT NULL DEFAULT 0
+);
+
+DROP TRIGGER IF EXISTS morphemes_after_insert;
+CREATE TRIGGER morphemes_after_insert AFTER INSERT ON morphemes FOR EACH ROW
+    UPDATE meta_counters SET row_count = row_count + 1 WHERE table_name = 'morphemes';
+
+DROP TRIGGER IF EXISTS morphemes_after_delete;
+CREATE TRIGGER morphemes_after_delete AFTER DELETE ON morphemes FOR EACH ROW
+    UPDATE meta_counters SET row_count = row_count - 1 WHERE table_name = 'morphemes';
+
+-- Resync with the rows already present (the triggers keep it current from here)
+REPLACE INTO meta_counters (table_name, row_count)
+SELECT 'morphemes', COUNT(*) FROM morphemes;
+
 -- Table for word forms and their morphological analysis
 CREATE TABLE IF NOT EXISTS word_analysis (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -59,10 +77,35 @@ CREATE TABLE IF NOT EXISTS tokens (
     is_punctuation BOOLEAN DEFAULT FALSE,
     is_stopword BOOLEAN DEFAULT FALSE,
     FOREIGN KEY (sentence_id) REFERENCES sentences(id) ON DELETE CASCADE,
-    INDEX idx_sentence (sentence_id),
+    INDEX idx_sentence_position (sentence_id, token_position),
     INDEX idx_token (token)
 );
 
+-- Databases created before idx_sentence_position have idx_sentence (sentence_id)
+-- instead: add the new index, then drop the old one, which it makes redundant
+-- (it backs the foreign key from here). Both steps are no-ops once done.
+SET @tokens_index_ddl = (
+    SELECT IF(COUNT(*) = 0,
+              'ALTER TABLE tokens ADD INDEX idx_sentence_position (sentence_id, token_position)',
+              'DO 0')
+    FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'tokens'
+      AND index_name = 'idx_sentence_position'
+);
+PREPARE tokens_index_stmt FROM @tokens_index_ddl;
+EXECUTE tokens_index_stmt;
+DEALLOCATE PREPARE tokens_index_stmt;
+
+SET @tokens_index_ddl = (
+    SELECT IF(COUNT(*) > 0, 'ALTER TABLE tokens DROP INDEX idx_sentence', 'DO 0')
+    FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'tokens'
+      AND index_name = 'idx_sentence'
+);
+PREPARE tokens_index_stmt FROM @tokens_index_ddl;
+EXECUTE tokens_index_stmt;
+DEALLOCATE PREPARE tokens_index_stmt;
+
 -- Table for morphological rules
 CREATE TABLE IF NOT EXISTS morphology_rules (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -77,22 +120,29 @@ CREATE TABLE IF NOT EXISTS morphology_rules (
     INDEX idx_priority (priority)
 );
 
--- Insert some common English morphemes
-INSERT INTO morphemes (morpheme, type, meaning) VALUES
-('un', 'prefix', 'not, opposite of'),
-('re', 'prefix', 'again, back'),
-('pre', 'prefix', 'before'),
-('post', 'prefix', 'after'),
-('anti', 'prefix', 'against'),
-('dis', 'prefix', 'not, opposite'),
-('ed', 'suffix', 'past tense'),
-('ing', 'suffix', 'present participle'),
-('ly', 'suffix', 'adverb marker'),
-('ness', 'suffix', 'state or quality'),
-('tion', 'suffix', 'action or process'),
-('able', 'suffix', 'capable of'),
-('less', 'suffix', 'without'),
-('ful', 'suffix', 'full of');
+-- Insert some common English morphemes (only the ones not there yet, so
+-- the script can be run again on an existing database)
+INSERT INTO morphemes (morpheme, type, meaning)
+SELECT seed.morpheme, seed.type, seed.meaning FROM (
+    SELECT 'un' AS morpheme, 'prefix' AS type, 'not, opposite of' AS meaning
+    UNION ALL SELECT 're', 'prefix', 'again, back'
+    UNION ALL SELECT 'pre', 'prefix', 'before'
+    UNION ALL SELECT 'post', 'prefix', 'after'
+    UNION ALL SELECT 'anti', 'prefix', 'against'
+    UNION ALL SELECT 'dis', 'prefix', 'not, opposite'
+    UNION ALL SELECT 'ed', 'suffix', 'past tense'
+    UNION ALL SELECT 'ing', 'suffix', 'present participle'
+    UNION ALL SELECT 'ly', 'suffix', 'adverb marker'
+    UNION ALL SELECT 'ness', 'suffix', 'state or quality'
+    UNION ALL SELECT 'tion', 'suffix', 'action or process'
+    UNION ALL SELECT 'able', 'suffix', 'capable of'
+    UNION ALL SELECT 'less', 'suffix', 'without'
+    UNION ALL SELECT 'ful', 'suffix', 'full of'
+) AS seed
+WHERE NOT EXISTS (
+    SELECT 1 FROM morphemes m
+    WHERE m.morpheme = seed.morpheme AND m.type = seed.type
+);
 
 -- Additional schema for Lexicon support
 
@@ -54,7 +54,7 @@ def setup_database():
             print(f"  ✓ Insert test passed (ID: {test_id})")
             
             # Clean up test
-            nlu.db_manager.execute_query(f"DELETE FROM text_segments WHERE id = {test_id}")
+            nlu.db_manager.execute_query("DELETE FROM text_segments WHERE id = %s", (test_id,))
             print(f"  ✓ Delete test passed")
         
         print("\n" + "=" * 60)
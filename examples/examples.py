@@ -8,15 +8,12 @@ from config import DB_CONFIG
 import json
 
 
-def example_basic_usage():
+def example_basic_usage(nlu: NLUSystem):
     """Basic usage example"""
     print("=" * 60)
     print("EXAMPLE 1: Basic Text Analysis")
     print("=" * 60)
     
-    # Initialize NLU system
-    nlu = NLUSystem(DB_CONFIG)
-    
     # Sample text
     text = """
     Natural language processing is fascinating! It enables computers to 
@@ -39,18 +36,15 @@ def example_basic_usage():
         print(f"  {i}. {sentence['text']}")
         print(f"     Words: {sentence['word_count']}")
     
-    nlu.close()
     print("\n")
 
 
-def example_segmentation():
+def example_segmentation(nlu: NLUSystem):
     """Segmentation-focused example"""
     print("=" * 60)
     print("EXAMPLE 2: Segmentation Analysis")
     print("=" * 60)
     
-    nlu = NLUSystem(DB_CONFIG)
-    
     text = "Dr. Smith went to Washington D.C. on Jan. 5th. He met Ms. Johnson there!"
     
     # Get segmentation results
@@ -67,18 +61,15 @@ def example_segmentation():
             print(f"  '{token['text']}' - Punct: {token['is_punctuation']}, "
                   f"Stopword: {token['is_stopword']}")
     
-    nlu.close()
     print("\n")
 
 
-def example_morphology():
+def example_morphology(nlu: NLUSystem):
     """Morphology-focused example"""
     print("=" * 60)
     print("EXAMPLE 3: Morphological Analysis")
     print("=" * 60)
     
-    nlu = NLUSystem(DB_CONFIG)
-    
     words = ['unhappiness', 'running', 'preprocessing', 'beautiful', 
              'children', 'went', 'carefully', 'reorganization']
     
@@ -100,18 +91,15 @@ def example_morphology():
             print(f"  Possible POS: {', '.join(analysis['possible_pos'])}")
         print()
     
-    nlu.close()
     print()
 
 
-def example_sentence_analysis():
+def example_sentence_analysis(nlu: NLUSystem):
     """Single sentence analysis"""
     print("=" * 60)
     print("EXAMPLE 4: Sentence Analysis")
     print("=" * 60)
     
-    nlu = NLUSystem(DB_CONFIG)
-    
     sentence = "The researchers carefully analyzed the preprocessing techniques."
     
     results = nlu.analyze_sentence(sentence)
@@ -130,35 +118,29 @@ def example_sentence_analysis():
         print(f"    Lemma: {morph['lemma']}")
         print(f"    Morphemes: {[m['form'] for m in morph['morphemes']]}")
     
-    nlu.close()
     print("\n")
 
 
-def example_lemmatization():
+def example_lemmatization(nlu: NLUSystem):
     """Lemmatization example"""
     print("=" * 60)
     print("EXAMPLE 5: Text Lemmatization")
     print("=" * 60)
     
-    nlu = NLUSystem(DB_CONFIG)
-    
     text = "The children were running quickly through the beautiful gardens."
     
     print(f"\nOriginal: {text}")
     print(f"Lemmatized: {nlu.lemmatize_text(text)}\n")
     
-    nlu.close()
     print()
 
 
-def example_add_morpheme():
+def example_add_morpheme(nlu: NLUSystem):
     """Example of adding custom morphemes"""
     print("=" * 60)
     print("EXAMPLE 6: Adding Custom Morphemes")
     print("=" * 60)
     
-    nlu = NLUSystem(DB_CONFIG)
-    
     # Add a custom prefix
     print("\nAdding custom morpheme 'cyber' as prefix...")
     morpheme_id = nlu.add_morpheme('cyber', 'prefix', 'relating to computers or internet')
@@ -172,18 +154,15 @@ def example_add_morpheme():
         print(f"  Prefix: {analysis['prefix']}")
         print(f"  Root: {analysis['root']}")
     
-    nlu.close()
     print("\n")
 
 
-def example_statistics():
+def example_statistics(nlu: NLUSystem):
     """Text statistics example"""
     print("=" * 60)
     print("EXAMPLE 7: Comprehensive Statistics")
     print("=" * 60)
     
-    nlu = NLUSystem(DB_CONFIG)
-    
     text = """
     Artificial intelligence and machine learning are transforming industries.
     These technologies enable computers to learn from data and make intelligent
@@ -195,7 +174,6 @@ def example_statistics():
     print("\nText Statistics:")
     print(json.dumps(stats, indent=2))
     
-    nlu.close()
     print("\n")
 
 
@@ -208,13 +186,21 @@ def main():
     print("Note: Make sure to update config.py with your database credentials!\n")
     
     try:
-        example_basic_usage()
-        example_segmentation()
-        example_morphology()
-        example_sentence_analysis()
-        example_lemmatization()
-        # example_add_morpheme()  # Uncomment to test database insertion
-        example_statistics()
+        # One system (and connection pool) shared by every example
+        nlu = NLUSystem(DB_CONFIG)
+    except Exception as e:
+        print(f"\nError running examples: {e}")
+        print("Please check your database configuration in config.py")
+        return
+    
+    try:
+        example_basic_usage(nlu)
+        example_segmentation(nlu)
+        example_morphology(nlu)
+        example_sentence_analysis(nlu)
+        example_lemmatization(nlu)
+        # example_add_morpheme(nlu)  # Uncomment to test database insertion
+        example_statistics(nlu)
         
         print("=" * 60)
         print("All examples completed successfully!")
@@ -223,6 +209,8 @@ def main():
     except Exception as e:
         print(f"\nError running examples: {e}")
         print("Please check your database configuration in config.py")
+    finally:
+        nlu.close()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Tests modules without database connection
 
 from modules.segmentation import Segmenter
 from modules.morphology import MorphologyAnalyzer
+from core.database import _split_statements
 
 
 def test_segmentation():
@@ -42,6 +43,12 @@ def test_segmentation():
         print(f"  '{token['text']}'  Punct: {token['is_punctuation']:<5}  "
               f"Stopword: {token['is_stopword']:<5}  Pos: {token['position']}")
     
+    # ASCII text takes the ASCII-flagged patterns; the \x1c-\x1f separators
+    # must still count as whitespace there, not as punctuation tokens
+    text = "one\x1ctwo\x1d three\x1f."
+    tokens = [token['text'] for token in segmenter.tokenize(text)]
+    assert tokens == ['one', 'two', 'three', '.'], tokens
+    
     # Test 4: Full processing
     print(f"\nTest 4: Full Text Processing")
     text = "AI is transforming the world. Machine learning enables computers to learn."
@@ -167,6 +174,32 @@ def test_integration():
     print("\n✓ Integration tests passed!\n")
 
 
+def test_statement_splitting():
+    """Test splitting of SQL scripts (used when loading the schema one statement at a time)"""
+    print("=" * 60)
+    print("TESTING SQL STATEMENT SPLITTING")
+    print("=" * 60)
+    
+    script = (
+        "CREATE TABLE/*x*/t (a INT); -- trailing comment\n"
+        "INSERT INTO t VALUES (1)# note\n;\n"
+        "INSERT INTO t VALUES ('a;b');"
+    )
+    statements = list(_split_statements(script))
+    print(f"\nInput: {script!r}")
+    for i, statement in enumerate(statements, 1):
+        print(f"  {i}. {statement!r}")
+    
+    # A removed comment leaves a space, so the words around it stay apart
+    assert statements == [
+        "CREATE TABLE t (a INT)",
+        "INSERT INTO t VALUES (1)",
+        "INSERT INTO t VALUES ('a;b')",
+    ], statements
+    
+    print("\n✓ Statement splitting tests passed!\n")
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -177,6 +210,7 @@ def main():
         test_segmentation()
         test_morphology()
         test_integration()
+        test_statement_splitting()
         
         print("=" * 60)
         print("ALL TESTS PASSED SUCCESSFULLY!")
@@ -4,7 +4,53 @@ Interactive test for segmentation, morphology, and database storage
 
 from nlu_system import NLUSystem
 from config import DB_CONFIG
+import argparse
+import io
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # optional fast path, stdlib json is the fallback
+    orjson = None
+
+# Display rules, built once instead of on every call
+RULE = '=' * 60
+SECTION_RULE = '-' * 40
+DIVIDER = '-' * 60
+
+# Per-token flag text, one entry per (is_punctuation, is_stopword) combination
+_PUNCT_STOP = {
+    (punct, stop): f"- Punct: {punct}, Stop: {stop}"
+    for punct in (True, False) for stop in (True, False)
+}
+_TOKEN_MARKERS = {
+    (True, True): " [PUNCT, STOP]",
+    (True, False): " [PUNCT]",
+    (False, True): " [STOP]",
+    (False, False): "",
+}
+
+
+def format_results_json(results):
+    """
+    Serialize processing results as indented JSON for display
+    
+    Uses orjson when it is installed, otherwise the standard library.
+    
+    Args:
+        results: Results dictionary from NLUSystem.process_text
+        
+    Returns:
+        Indented JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ).decode()
+    return json.dumps(results, indent=2, default=str)
 
 
 def process_and_store_sentence(nlu, sentence):
@@ -15,20 +61,32 @@ def process_and_store_sentence(nlu, sentence):
         nlu: NLUSystem instance
         sentence: Input sentence to process
     """
-    print(f"\n{'='*60}")
+    print(f"\n{RULE}")
     print(f"Processing: {sentence}")
-    print(f"{'='*60}\n")
+    print(f"{RULE}\n")
     
-    # Process with morphology and store results
-    results = nlu.process_text(
-        sentence, 
-        analyze_morphology=True, 
-        store_results=True  # This stores in database
-    )
+    # Process with morphology and store results, committed once at the end
+    with nlu.transaction():
+        results = nlu.process_text(
+            sentence, 
+            analyze_morphology=True, 
+            store_results=True  # This stores in database
+        )
     
+    display_results(results)
+    return results
+
+
+def display_results(results):
+    """
+    Display segmentation, morphology and statistics for processed text
+    
+    Args:
+        results: Results dictionary from NLUSystem.process_text
+    """
     # Display segmentation results
     print("SEGMENTATION:")
-    print("-" * 40)
+    print(SECTION_RULE)
     seg = results.get('segmentation', {})
     print(f"Sentences: {seg.get('sentence_count', 0)}")
     
@@ -40,31 +98,36 @@ def process_and_store_sentence(nlu, sentence):
         print(f"Tokens: {len(tokens)}")
         
         print(f"\nToken details:")
-        for token in tokens:
-            text = token.get('text', '')
-            is_punct = token.get('is_punctuation', False)
-            is_stop = token.get('is_stopword', False)
-            print(f"  '{text:15}' - Punct: {is_punct}, Stop: {is_stop}")
+        if tokens:
+            lines = [
+                "  '%-15s' %s" % (
+                    token.get('text', ''),
+                    _PUNCT_STOP[token.get('is_punctuation', False), token.get('is_stopword', False)]
+                )
+                for token in tokens
+            ]
+            print("\n".join(lines))
     
     # Display morphological analysis
     print("\nMORPHOLOGICAL ANALYSIS:")
-    print("-" * 40)
+    print(SECTION_RULE)
     morphology = results.get('morphology', [])
     
     if not morphology:
         print("  No morphological analysis available")
     else:
+        buf = io.StringIO()
         for morph in morphology:
             original = morph.get('original', '')
             lemma = morph.get('lemma', '')
             morphemes = morph.get('morphemes', [])
             
-            print(f"\n  Word: {original}")
-            print(f"    Lemma: {lemma}")
+            buf.write(f"\n  Word: {original}\n")
+            buf.write(f"    Lemma: {lemma}\n")
             
             if morphemes:
                 morpheme_forms = [m.get('form', '') for m in morphemes]
-                print(f"    Morphemes: {' + '.join(morpheme_forms)}")
+                buf.write(f"    Morphemes: {' + '.join(morpheme_forms)}\n")
             
             prefix = morph.get('prefix')
             root = morph.get('root')
@@ -72,17 +135,18 @@ def process_and_store_sentence(nlu, sentence):
             possible_pos = morph.get('possible_pos', [])
             
             if prefix:
-                print(f"    Prefix: {prefix}")
+                buf.write(f"    Prefix: {prefix}\n")
             if root:
-                print(f"    Root: {root}")
+                buf.write(f"    Root: {root}\n")
             if suffix:
-                print(f"    Suffix: {suffix}")
+                buf.write(f"    Suffix: {suffix}\n")
             if possible_pos:
-                print(f"    Possible POS: {', '.join(possible_pos)}")
+                buf.write(f"    Possible POS: {', '.join(possible_pos)}\n")
+        sys.stdout.write(buf.getvalue())
     
     # Display statistics
     print("\nSTATISTICS:")
-    print("-" * 40)
+    print(SECTION_RULE)
     stats = results.get('statistics', {})
     if stats:
         for key, value in stats.items():
@@ -91,17 +155,17 @@ def process_and_store_sentence(nlu, sentence):
         print("  No statistics available")
     
     print(f"\n✓ Data stored in database successfully!\n")
-    
-    return results
 
 
 def verify_database_storage(nlu):
     """
     Verify what's stored in the database
     """
-    print(f"\n{'='*60}")
+    nlu.flush()
+    
+    print(f"\n{RULE}")
     print("DATABASE CONTENTS")
-    print(f"{'='*60}\n")
+    print(f"{RULE}\n")
     
     try:
         # Get table counts using DatabaseManager method
@@ -115,58 +179,53 @@ def verify_database_storage(nlu):
         
         # Show recent text segments
         print("\nRecent text segments (last 5):")
-        print("-" * 60)
+        print(DIVIDER)
         segments = nlu.db_manager.get_recent_text_segments(5)
         for seg in segments:
-            print(f"  [{seg['id']:3d}] Sentences: {seg['sentence_count']} | "
-                  f"Words: {seg['word_count']:3d} | {seg['text_preview']}...")
-            print(f"         Processed: {seg['processed_at']}")
+            print(f"  [{seg.id:3d}] Sentences: {seg.sentence_count} | "
+                  f"Words: {seg.word_count:3d} | {seg.text_preview}...")
+            print(f"         Processed: {seg.processed_at}")
         
         # Show recent sentences
         print("\nRecent sentences (last 10):")
-        print("-" * 60)
+        print(DIVIDER)
         sentences = nlu.db_manager.get_recent_sentences(10)
         for sent in sentences:
-            print(f"  [{sent['id']:3d}] Pos: {sent['sentence_position']} | "
-                  f"Words: {sent['word_count']:2d} | {sent['text']}")
+            print(f"  [{sent.id:3d}] Pos: {sent.sentence_position} | "
+                  f"Words: {sent.word_count:2d} | {sent.text}")
         
         # Show tokens from most recent sentence
         print("\nTokens from most recent sentence:")
-        print("-" * 60)
+        print(DIVIDER)
         tokens = nlu.db_manager.get_tokens_by_sentence(limit=15)
         
         if tokens:
             for token in tokens:
-                markers = []
-                if token['is_punctuation']:
-                    markers.append("PUNCT")
-                if token['is_stopword']:
-                    markers.append("STOP")
-                marker_str = f" [{', '.join(markers)}]" if markers else ""
-                print(f"    {token['token_position']:2d}. {token['token']:15s}{marker_str}")
+                marker_str = _TOKEN_MARKERS[bool(token.is_punctuation), bool(token.is_stopword)]
+                print(f"    {token.token_position:2d}. {token.token:15s}{marker_str}")
         else:
             print("    No tokens found")
         
         # Show recent word analyses
         print("\nRecent word analyses (last 10):")
-        print("-" * 60)
+        print(DIVIDER)
         analyses = nlu.db_manager.get_recent_word_analyses(10)
         
         if analyses:
             for analysis in analyses:
                 parts = []
-                if analysis['prefix']:
-                    parts.append(f"prefix:{analysis['prefix']}")
-                if analysis['root']:
-                    parts.append(f"root:{analysis['root']}")
-                if analysis['suffix']:
-                    parts.append(f"suffix:{analysis['suffix']}")
+                if analysis.prefix:
+                    parts.append(f"prefix:{analysis.prefix}")
+                if analysis.root:
+                    parts.append(f"root:{analysis.root}")
+                if analysis.suffix:
+                    parts.append(f"suffix:{analysis.suffix}")
                 
                 morphology_str = " + ".join(parts) if parts else "N/A"
-                pos_str = f"[{analysis['pos_tag']}]" if analysis['pos_tag'] else ""
-                lemma_str = f"→ {analysis['lemma']}" if analysis['lemma'] and analysis['lemma'] != analysis['word'] else ""
+                pos_str = f"[{analysis.pos_tag}]" if analysis.pos_tag else ""
+                lemma_str = f"→ {analysis.lemma}" if analysis.lemma and analysis.lemma != analysis.word else ""
                 
-                print(f"  {analysis['word']:20s} {pos_str:10s} {lemma_str:15s} | {morphology_str}")
+                print(f"  {analysis.word:20s} {pos_str:10s} {lemma_str:15s} | {morphology_str}")
         else:
             print("    No word analyses found")
             
@@ -180,9 +239,9 @@ def clear_database_data(nlu):
     """
     Clear data from analysis tables (keeps morpheme dictionary)
     """
-    print(f"\n{'='*60}")
+    print(f"\n{RULE}")
     print("CLEAR DATABASE DATA")
-    print(f"{'='*60}\n")
+    print(f"{RULE}\n")
     
     print("⚠️  WARNING: This will delete all stored analysis data!")
     print("\nTables that will be cleared:")
@@ -199,6 +258,9 @@ def clear_database_data(nlu):
         return
     
     try:
+        # Write out buffered analyses first so they are cleared as well
+        nlu.flush()
+        
         # Use DatabaseManager method to clear data
         result = nlu.db_manager.clear_analysis_data()
         
@@ -229,11 +291,19 @@ def clear_database_data(nlu):
         traceback.print_exc()
 
 
+# Interactive commands, keyed by the normalized (stripped, lowercased) input
+QUIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
+COMMANDS = {
+    'show': verify_database_storage,
+    'clear': clear_database_data,
+}
+
+
 def interactive_mode():
     """Interactive mode for entering sentences"""
-    print("=" * 60)
+    print(RULE)
     print("INTERACTIVE SEGMENTATION & MORPHOLOGY TEST")
-    print("=" * 60)
+    print(RULE)
     print("\nNote: Make sure config.py has correct database credentials!")
     print()
     
@@ -243,19 +313,17 @@ def interactive_mode():
         print("✓ NLU System initialized successfully\n")
         
         while True:
-            print("-" * 60)
+            print(DIVIDER)
             sentence = input("\nEnter a sentence (or 'quit'/'show'/'clear'): ").strip()
+            command = sentence.lower()
             
-            if sentence.lower() in ['quit', 'exit', 'q']:
+            if command in QUIT_COMMANDS:
                 print("\nExiting...")
                 break
             
-            if sentence.lower() == 'show':
-                verify_database_storage(nlu)
-                continue
-            
-            if sentence.lower() == 'clear':
-                clear_database_data(nlu)
+            handler = COMMANDS.get(command)
+            if handler:
+                handler(nlu)
                 continue
             
             if not sentence:
@@ -270,7 +338,7 @@ def interactive_mode():
                 show_details = input("\nShow detailed JSON results? (y/n): ").strip().lower()
                 if show_details == 'y':
                     print("\nDetailed Results:")
-                    print(json.dumps(results, indent=2, default=str))
+                    print(format_results_json(results))
                 
             except Exception as e:
                 print(f"\n✗ Error processing sentence: {e}")
@@ -278,9 +346,9 @@ def interactive_mode():
                 traceback.print_exc()
         
         # Final database summary
-        print("\n" + "=" * 60)
+        print(f"\n{RULE}")
         verify_database_storage(nlu)
-        print("=" * 60)
+        print(RULE)
         
         nlu.close()
         print("\n✓ System closed successfully")
@@ -292,11 +360,18 @@ def interactive_mode():
         traceback.print_exc()
 
 
-def test_mode():
-    """Test mode with predefined sentences"""
-    print("=" * 60)
+def test_mode(quiet=False, batch_size=None):
+    """
+    Test mode with predefined sentences
+    
+    Args:
+        quiet: Skip the per-sentence output and the pauses between sentences
+        batch_size: Process the sentences in batches of this size through
+            NLUSystem.process_texts instead of one at a time
+    """
+    print(RULE)
     print("TEST MODE - Predefined Sentences")
-    print("=" * 60)
+    print(RULE)
     
     # Ask if user wants to clear database first
     clear_first = input("\nClear database before testing? (y/n): ").strip().lower()
@@ -317,22 +392,47 @@ def test_mode():
             clear_database_data(nlu)
             print()
         
-        for i, sentence in enumerate(test_sentences, 1):
-            print(f"\n[Test {i}/{len(test_sentences)}]")
-            
+        if batch_size:
             try:
-                process_and_store_sentence(nlu, sentence)
+                with nlu.transaction():
+                    batch_results = nlu.process_texts(
+                        test_sentences,
+                        analyze_morphology=True,
+                        store_results=True,
+                        batch_size=batch_size
+                    )
+                if not quiet:
+                    for i, (sentence, results) in enumerate(zip(test_sentences, batch_results), 1):
+                        print(f"\n[Test {i}/{len(test_sentences)}]")
+                        print(f"\n{RULE}")
+                        print(f"Processed: {sentence}")
+                        print(f"{RULE}\n")
+                        display_results(results)
             except Exception as e:
-                print(f"\n✗ Error processing sentence: {e}")
+                print(f"\n✗ Error processing sentences: {e}")
                 import traceback
                 traceback.print_exc()
-            
-            if i < len(test_sentences):
-                input("\nPress Enter to continue...")
+        else:
+            for i, sentence in enumerate(test_sentences, 1):
+                print(f"\n[Test {i}/{len(test_sentences)}]")
+                
+                try:
+                    if quiet:
+                        with nlu.transaction():
+                            nlu.process_text(sentence, analyze_morphology=True, store_results=True)
+                    else:
+                        process_and_store_sentence(nlu, sentence)
+                except Exception as e:
+                    print(f"\n✗ Error processing sentence: {e}")
+                    import traceback
+                    traceback.print_exc()
+                
+                if i < len(test_sentences) and not quiet:
+                    input("\nPress Enter to continue...")
         
-        print("\n" + "=" * 60)
+        print(f"\n{RULE}")
         verify_database_storage(nlu)
-        print("=" * 60)
+        print(RULE)
         
         nlu.close()
         print("\n✓ All tests completed successfully")
@@ -343,18 +443,41 @@ def test_mode():
         traceback.print_exc()
 
 
+def positive_int(value):
+    """argparse type for options that take a count of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="NLU system segmentation & morphology test")
+    parser.add_argument('--quiet', action='store_true',
+                        help="test mode: skip per-sentence output and pauses")
+    parser.add_argument('--batch-size', type=positive_int, default=None, metavar='N',
+                        help="test mode: process sentences in batches of N")
+    return parser.parse_args(argv)
+
+
 def main():
     """Main function"""
-    print("\n" + "=" * 60)
+    args = parse_args()
+    
+    print(f"\n{RULE}")
     print("NLU SYSTEM - SEGMENTATION & MORPHOLOGY TEST")
-    print("=" * 60 + "\n")
+    print(f"{RULE}\n")
     
     mode = input("Choose mode:\n1. Interactive (enter your own sentences)\n2. Test (use predefined sentences)\n3. Clear database only\n\nEnter choice (1/2/3): ").strip()
     
     if mode == '1':
         interactive_mode()
     elif mode == '2':
-        test_mode()
+        test_mode(quiet=args.quiet, batch_size=args.batch_size)
     elif mode == '3':
         try:
             nlu = NLUSystem(DB_CONFIG)
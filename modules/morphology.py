@@ -3,12 +3,65 @@ Morphology Module
 Handles morphological analysis: roots, affixes, lemmatization, and word formation
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import re
+from types import MappingProxyType
 from typing import List, Dict, Tuple, Optional, Any
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Distinct lowercased words whose analysis each analyzer keeps
+ANALYSIS_CACHE_SIZE = 100_000
+
+# Buffered word analyses that trigger a write to the database
+FLUSH_THRESHOLD = 1000
+
+# Pending analyses above which a flush goes through LOAD DATA instead of
+# INSERT; below it the extra connection and temp file cost more than they save
+BULK_LOAD_THRESHOLD = 5000
+
+# Distinct words whose lemma each analyzer keeps
+LEMMA_CACHE_SIZE = 50_000
+
+# Smallest batch analyze_batch() hands to worker processes; below it
+# starting the pool costs more than the analysis
+PARALLEL_MIN_WORDS = 2000
+
+# Seconds morpheme dictionaries loaded from a database are reused
+MORPHEME_CACHE_TTL = 60.0
+
+# (host, port, database) -> (prefixes, suffixes, roots, expires_at)
+_MORPHEME_CACHE: Dict[tuple, Tuple[Dict[str, str], Dict[str, str], Dict[str, str], float]] = {}
+
+# Analyzer of a worker process started by analyze_batch()
+_worker_analyzer = None
+
+
+def _init_worker(prefixes: Dict[str, str], suffixes: Dict[str, str], roots: Dict[str, str]):
+    """Build the worker's analyzer from the parent's morpheme dictionaries"""
+    global _worker_analyzer
+    _worker_analyzer = MorphologyAnalyzer(None)
+    _worker_analyzer.prefixes = prefixes
+    _worker_analyzer.suffixes = suffixes
+    _worker_analyzer.roots = roots
+    _worker_analyzer._index_affixes()
+
+
+def _analyze_chunk(words: List[str]) -> List[Dict[str, Any]]:
+    """Analyze a slice of an analyze_batch() call in a worker process"""
+    return [_worker_analyzer.analyze_word(word) for word in words]
+
+
+def _group_by_length(affixes: Dict[str, str]) -> List[Tuple[int, Dict[str, str]]]:
+    """Return (length, {affix: value}) pairs, longest first"""
+    by_len: Dict[int, Dict[str, str]] = {}
+    for affix, value in affixes.items():
+        by_len.setdefault(len(affix), {})[affix] = value
+    return sorted(by_len.items(), reverse=True)
+
 
 class MorphologyAnalyzer:
     """
@@ -16,27 +69,9 @@ class MorphologyAnalyzer:
     Analyzes word structure, identifies roots, prefixes, suffixes, and performs lemmatization
     """
     
-    def __init__(self, db_manager=None):
-        """
-        Initialize morphology analyzer
-        
-        Args:
-            db_manager: DatabaseManager instance for accessing morpheme database
-        """
-        self.db_manager = db_manager
-        
-        # Load morphemes from database or use defaults
-        self.prefixes = {}
-        self.suffixes = {}
-        self.roots = {}
-        
-        if db_manager:
-            self._load_morphemes()
-        else:
-            self._load_default_morphemes()
-        
-        # English inflection rules
-        self.inflection_rules = [
+    # English inflection rules, compiled once for all instances
+    inflection_rules = tuple(
+        (re.compile(pattern), replacement, tag) for pattern, replacement, tag in [
             # Plural rules
             (r'([^aeiou])y$', r'\1ies', 'plural'),  # baby -> babies
             (r'(s|x|z|ch|sh)$', r'\1es', 'plural'),  # box -> boxes
@@ -64,49 +99,120 @@ class MorphologyAnalyzer:
             (r'e$', r'est', 'superlative'),  # nice -> nicest
             (r'$', r'est', 'superlative'),  # fast -> fastest
         ]
+    )
+    
+    # Irregular forms (common English), read-only and shared by all instances
+    irregular_verbs = MappingProxyType({
+        'was': 'be', 'were': 'be', 'been': 'be', 'being': 'be',
+        'had': 'have', 'has': 'have', 'having': 'have',
+        'did': 'do', 'does': 'do', 'done': 'do', 'doing': 'do',
+        'went': 'go', 'gone': 'go', 'going': 'go',
+        'saw': 'see', 'seen': 'see', 'seeing': 'see',
+        'took': 'take', 'taken': 'take', 'taking': 'take',
+        'came': 'come', 'coming': 'come',
+        'got': 'get', 'gotten': 'get', 'getting': 'get',
+        'made': 'make', 'making': 'make',
+        'said': 'say', 'saying': 'say',
+        'thought': 'think', 'thinking': 'think',
+        'found': 'find', 'finding': 'find',
+        'gave': 'give', 'given': 'give', 'giving': 'give',
+        'told': 'tell', 'telling': 'tell',
+        'felt': 'feel', 'feeling': 'feel',
+        'knew': 'know', 'known': 'know', 'knowing': 'know',
+        'left': 'leave', 'leaving': 'leave',
+        'kept': 'keep', 'keeping': 'keep',
+        'held': 'hold', 'holding': 'hold',
+        'wrote': 'write', 'written': 'write', 'writing': 'write',
+        'stood': 'stand', 'standing': 'stand',
+        'heard': 'hear', 'hearing': 'hear',
+        'brought': 'bring', 'bringing': 'bring',
+        'began': 'begin', 'begun': 'begin', 'beginning': 'begin',
+        'ran': 'run', 'running': 'run',
+        'sat': 'sit', 'sitting': 'sit',
+        'spoke': 'speak', 'spoken': 'speak', 'speaking': 'speak',
+        'ate': 'eat', 'eaten': 'eat', 'eating': 'eat',
+    })
+    
+    irregular_plurals = MappingProxyType({
+        'children': 'child',
+        'men': 'man',
+        'women': 'woman',
+        'feet': 'foot',
+        'teeth': 'tooth',
+        'mice': 'mouse',
+        'geese': 'goose',
+        'people': 'person',
+    })
+    
+    # Parts of speech suggested by a derivational or inflectional suffix
+    suffix_pos = MappingProxyType({
+        'ly': ('adverb',),
+        'ness': ('noun',),
+        'tion': ('noun',),
+        'sion': ('noun',),
+        'ment': ('noun',),
+        'ity': ('noun',),
+        'er': ('noun', 'adjective'),
+        'est': ('adjective',),
+        'able': ('adjective',),
+        'ible': ('adjective',),
+        'ful': ('adjective',),
+        'less': ('adjective',),
+        'ous': ('adjective',),
+        'ive': ('adjective',),
+        'al': ('adjective',),
+        'ed': ('verb', 'adjective'),
+        'ing': ('verb', 'noun', 'adjective'),
+        's': ('noun', 'verb'),
+        'es': ('noun', 'verb'),
+        'ize': ('verb',),
+        'ise': ('verb',),
+    })
+    
+    # Inflectional suffixes stripped by lemmatize(), with their replacements.
+    # Where one suffix ends another the longer one comes first, so trying
+    # them longest first (one lookup per length) picks the same rule.
+    lemma_suffixes = (
+        ('ies', 'y'),    # babies -> baby
+        ('ied', 'y'),    # cried -> cry
+        ('ying', 'ie'),  # dying -> die
+        ('sses', 'ss'),  # classes -> class
+        ('xes', 'x'),    # boxes -> box
+        ('zes', 'z'),    # buzzes -> buzz
+        ('ches', 'ch'),  # watches -> watch
+        ('shes', 'sh'),  # wishes -> wish
+        ('ves', 'f'),    # leaves -> leaf
+        ('ing', ''),     # walking -> walk
+        ('ed', ''),      # walked -> walk
+        ('es', ''),      # boxes -> box
+        ('s', ''),       # cats -> cat
+    )
+    _lemma_suffixes_by_len = tuple(_group_by_length(dict(lemma_suffixes)))
+    
+    def __init__(self, db_manager=None):
+        """
+        Initialize morphology analyzer
         
-        # Irregular forms (common English)
-        self.irregular_verbs = {
-            'was': 'be', 'were': 'be', 'been': 'be', 'being': 'be',
-            'had': 'have', 'has': 'have', 'having': 'have',
-            'did': 'do', 'does': 'do', 'done': 'do', 'doing': 'do',
-            'went': 'go', 'gone': 'go', 'going': 'go',
-            'saw': 'see', 'seen': 'see', 'seeing': 'see',
-            'took': 'take', 'taken': 'take', 'taking': 'take',
-            'came': 'come', 'coming': 'come',
-            'got': 'get', 'gotten': 'get', 'getting': 'get',
-            'made': 'make', 'making': 'make',
-            'said': 'say', 'saying': 'say',
-            'thought': 'think', 'thinking': 'think',
-            'found': 'find', 'finding': 'find',
-            'gave': 'give', 'given': 'give', 'giving': 'give',
-            'told': 'tell', 'telling': 'tell',
-            'felt': 'feel', 'feeling': 'feel',
-            'knew': 'know', 'known': 'know', 'knowing': 'know',
-            'left': 'leave', 'leaving': 'leave',
-            'kept': 'keep', 'keeping': 'keep',
-            'held': 'hold', 'holding': 'hold',
-            'wrote': 'write', 'written': 'write', 'writing': 'write',
-            'stood': 'stand', 'standing': 'stand',
-            'heard': 'hear', 'hearing': 'hear',
-            'brought': 'bring', 'bringing': 'bring',
-            'began': 'begin', 'begun': 'begin', 'beginning': 'begin',
-            'ran': 'run', 'running': 'run',
-            'sat': 'sit', 'sitting': 'sit',
-            'spoke': 'speak', 'spoken': 'speak', 'speaking': 'speak',
-            'ate': 'eat', 'eaten': 'eat', 'eating': 'eat',
-        }
+        Args:
+            db_manager: DatabaseManager instance for accessing morpheme database
+        """
+        self.db_manager = db_manager
         
-        self.irregular_plurals = {
-            'children': 'child',
-            'men': 'man',
-            'women': 'woman',
-            'feet': 'foot',
-            'teeth': 'tooth',
-            'mice': 'mouse',
-            'geese': 'goose',
-            'people': 'person',
-        }
+        # Word analysis records waiting for the next bulk insert
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_threshold = FLUSH_THRESHOLD
+        
+        self._lemmatize_cached = functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)(self._lemmatize_lower)
+        
+        # Load morphemes from database or use defaults
+        self.prefixes = {}
+        self.suffixes = {}
+        self.roots = {}
+        
+        if db_manager:
+            self._load_morphemes()
+        else:
+            self._load_default_morphemes()
     
     def _load_default_morphemes(self):
         """Load default morpheme dictionaries"""
@@ -155,28 +261,54 @@ class MorphologyAnalyzer:
             'ize': 'make/become',
             'ise': 'make/become',
         }
+        
+        self._index_affixes()
     
-    def _load_morphemes(self):
-        """Load morphemes from database"""
+    def _load_morphemes(self, refresh: bool = False):
+        """
+        Load morphemes from database
+        
+        The dictionaries are shared through a module-level cache for
+        MORPHEME_CACHE_TTL seconds, so analyzers created against the same
+        database in quick succession don't each query it.
+        
+        Args:
+            refresh: Ignore the cache and reload (after adding morphemes)
+        """
         if not self.db_manager:
             self._load_default_morphemes()
             return
+        
+        config = getattr(self.db_manager, 'config', None)
+        cache_key = (config.get('host'), config.get('port'), config.get('database')) if config else None
+        cached = _MORPHEME_CACHE.get(cache_key) if cache_key and not refresh else None
+        if cached and cached[3] > time.monotonic():
+            self.prefixes, self.suffixes, self.roots = (dict(d) for d in cached[:3])
+            self._index_affixes()
+            logger.debug("Using cached morpheme dictionaries")
+            return
             
         try:
-            # Load prefixes
-            prefixes_query = "SELECT morpheme, meaning FROM morphemes WHERE type = 'prefix'"
-            prefix_results = self.db_manager.fetch_all(prefixes_query)
-            self.prefixes = {r['morpheme']: r['meaning'] for r in prefix_results}
+            # One round trip for all three types, bucketed here
+            query = """
+                SELECT type, morpheme, meaning FROM morphemes
+                WHERE type IN ('prefix', 'suffix', 'root')
+            """
+            buckets: Dict[str, Dict[str, str]] = {'prefix': {}, 'suffix': {}, 'root': {}}
+            for morpheme_type, morpheme, meaning in self.db_manager.fetch_rows(query):
+                buckets[morpheme_type][morpheme] = meaning
             
-            # Load suffixes
-            suffixes_query = "SELECT morpheme, meaning FROM morphemes WHERE type = 'suffix'"
-            suffix_results = self.db_manager.fetch_all(suffixes_query)
-            self.suffixes = {r['morpheme']: r['meaning'] for r in suffix_results}
+            self.prefixes = buckets['prefix']
+            self.suffixes = buckets['suffix']
+            self.roots = buckets['root']
+            self._index_affixes()
             
-            # Load roots
-            roots_query = "SELECT morpheme, meaning FROM morphemes WHERE type = 'root'"
-            root_results = self.db_manager.fetch_all(roots_query)
-            self.roots = {r['morpheme']: r['meaning'] for r in root_results}
+            # An empty result may just be a failed query, so don't keep it
+            if cache_key and any(buckets.values()):
+                _MORPHEME_CACHE[cache_key] = (
+                    dict(self.prefixes), dict(self.suffixes), dict(self.roots),
+                    time.monotonic() + MORPHEME_CACHE_TTL
+                )
             
             logger.info(f"Loaded {len(self.prefixes)} prefixes, {len(self.suffixes)} suffixes, {len(self.roots)} roots")
         except Exception as e:
@@ -193,10 +325,17 @@ class MorphologyAnalyzer:
         Returns:
             Dictionary with morphological analysis
         """
-        word_lower = word.lower()
-        
+        # Word types repeat heavily, so the analysis of each lowercased form
+        # is memoized; callers get their own copy of the mutable parts
+        cached = self._analyze_cached(word.lower())
+        analysis = {'original': word, **cached}
+        analysis['morphemes'] = [dict(morpheme) for morpheme in cached['morphemes']]
+        analysis['possible_pos'] = list(cached['possible_pos'])
+        return analysis
+    
+    def _analyze_lower(self, word_lower: str) -> Dict[str, Any]:
+        """Analyze a lowercased word (everything but 'original'), see analyze_word"""
         analysis = {
-            'original': word,
             'lemma': self.lemmatize(word_lower),
             'prefix': None,
             'root': None,
@@ -270,60 +409,52 @@ class MorphologyAnalyzer:
         
         return analysis
     
+    def _index_affixes(self):
+        """
+        Group prefixes and suffixes by length for _identify_prefix/_identify_suffix
+        
+        Must be called again whenever self.prefixes, self.suffixes or
+        self.roots is replaced.
+        """
+        self._prefixes_by_len = _group_by_length(self.prefixes)
+        self._suffixes_by_len = _group_by_length(self.suffixes)
+        
+        # Analyses depend on the dictionaries, so start a fresh cache
+        self._analyze_cached = functools.lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._analyze_lower)
+    
     def _identify_prefix(self, word: str) -> Optional[Dict[str, str]]:
-        """Identify prefix in a word"""
-        for prefix, meaning in sorted(self.prefixes.items(), key=lambda x: len(x[0]), reverse=True):
-            if word.startswith(prefix):
-                remaining = word[len(prefix):]
-                # Ensure remaining part is substantial
-                if len(remaining) >= 3:
-                    return {
-                        'prefix': prefix,
-                        'meaning': meaning,
-                        'remaining': remaining
-                    }
+        """Identify prefix in a word (longest match leaving at least 3 characters)"""
+        for length, prefixes in self._prefixes_by_len:
+            # Ensure remaining part is substantial
+            if len(word) - length < 3:
+                continue
+            prefix = word[:length]
+            if prefix in prefixes:
+                return {
+                    'prefix': prefix,
+                    'meaning': prefixes[prefix],
+                    'remaining': word[length:]
+                }
         return None
     
     def _identify_suffix(self, word: str) -> Optional[Dict[str, str]]:
-        """Identify suffix in a word"""
-        for suffix, meaning in sorted(self.suffixes.items(), key=lambda x: len(x[0]), reverse=True):
-            if word.endswith(suffix):
-                remaining = word[:-len(suffix)]
-                # Ensure remaining part is substantial
-                if len(remaining) >= 3:
-                    return {
-                        'suffix': suffix,
-                        'meaning': meaning,
-                        'remaining': remaining
-                    }
+        """Identify suffix in a word (longest match leaving at least 3 characters)"""
+        for length, suffixes in self._suffixes_by_len:
+            # Ensure remaining part is substantial (an empty suffix never leaves any)
+            if length == 0 or len(word) - length < 3:
+                continue
+            suffix = word[-length:]
+            if suffix in suffixes:
+                return {
+                    'suffix': suffix,
+                    'meaning': suffixes[suffix],
+                    'remaining': word[:-length]
+                }
         return None
     
-    def _infer_pos_from_suffix(self, suffix: str) -> List[str]:
+    def _infer_pos_from_suffix(self, suffix: str) -> Tuple[str, ...]:
         """Infer possible parts of speech from suffix"""
-        pos_map = {
-            'ly': ['adverb'],
-            'ness': ['noun'],
-            'tion': ['noun'],
-            'sion': ['noun'],
-            'ment': ['noun'],
-            'ity': ['noun'],
-            'er': ['noun', 'adjective'],
-            'est': ['adjective'],
-            'able': ['adjective'],
-            'ible': ['adjective'],
-            'ful': ['adjective'],
-            'less': ['adjective'],
-            'ous': ['adjective'],
-            'ive': ['adjective'],
-            'al': ['adjective'],
-            'ed': ['verb', 'adjective'],
-            'ing': ['verb', 'noun', 'adjective'],
-            's': ['noun', 'verb'],
-            'es': ['noun', 'verb'],
-            'ize': ['verb'],
-            'ise': ['verb'],
-        }
-        return pos_map.get(suffix, [])
+        return self.suffix_pos.get(suffix, ())
     
     def lemmatize(self, word: str) -> str:
         """
@@ -335,43 +466,27 @@ class MorphologyAnalyzer:
         Returns:
             Lemmatized form
         """
-        word_lower = word.lower()
-        
+        return self._lemmatize_cached(word.lower())
+    
+    def _lemmatize_lower(self, word_lower: str) -> str:
+        """Lemmatize a lowercased word, see lemmatize"""
         # Check irregular forms
         if word_lower in self.irregular_verbs:
             return self.irregular_verbs[word_lower]
         if word_lower in self.irregular_plurals:
             return self.irregular_plurals[word_lower]
         
-        # Try removing common suffixes
-        lemma = word_lower
-        
-        # Remove inflectional suffixes
-        suffixes_to_try = [
-            ('ies', 'y'),    # babies -> baby
-            ('ied', 'y'),    # cried -> cry
-            ('ying', 'ie'),  # dying -> die
-            ('sses', 'ss'),  # classes -> class
-            ('xes', 'x'),    # boxes -> box
-            ('zes', 'z'),    # buzzes -> buzz
-            ('ches', 'ch'),  # watches -> watch
-            ('shes', 'sh'),  # wishes -> wish
-            ('ves', 'f'),    # leaves -> leaf
-            ('ing', ''),     # walking -> walk
-            ('ed', ''),      # walked -> walk
-            ('es', ''),      # boxes -> box
-            ('s', ''),       # cats -> cat
-        ]
-        
-        for suffix, replacement in suffixes_to_try:
-            if lemma.endswith(suffix):
-                potential_lemma = lemma[:-len(suffix)] + replacement
-                # Simple validation: lemma should be at least 2 chars
-                if len(potential_lemma) >= 2:
-                    lemma = potential_lemma
-                    break
-        
-        return lemma
+        # Remove inflectional suffixes: the longest matching one whose
+        # result is still at least 2 chars
+        word_len = len(word_lower)
+        for length, replacements in self._lemma_suffixes_by_len:
+            if word_len < length:
+                continue
+            replacement = replacements.get(word_lower[-length:])
+            if replacement is not None and word_len - length + len(replacement) >= 2:
+                return word_lower[:-length] + replacement
+        
+        return word_lower
     
     def segment_morphemes(self, word: str) -> List[str]:
         """
@@ -391,36 +506,48 @@ class MorphologyAnalyzer:
         
         return morphemes
     
-    def analyze_batch(self, words: List[str], store_in_db: bool = True) -> List[Dict[str, Any]]:
+    def analyze_batch(self, words: List[str], store_in_db: bool = True,
+                      workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Analyze multiple words
         
         Args:
             words: List of words
             store_in_db: Whether to store results in database
+            workers: Analyze in this many processes when there are at least
+                PARALLEL_MIN_WORDS words (default: in this process)
         
         Returns:
             List of analysis results
         """
-        results = []
-        
-        for word in words:
-            analysis = self.analyze_word(word)
-            results.append(analysis)
+        if workers and workers > 1 and len(words) >= PARALLEL_MIN_WORDS:
+            # Workers get copies of the dictionaries and never touch the
+            # database; results are stored from this process below
+            size = -(-len(words) // workers)
+            chunks = [words[start:start + size] for start in range(0, len(words), size)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self.prefixes, self.suffixes, self.roots)) as executor:
+                results = [analysis for chunk in executor.map(_analyze_chunk, chunks)
+                           for analysis in chunk]
+        else:
+            results = [self.analyze_word(word) for word in words]
         
         # Store in database if requested
         if store_in_db and self.db_manager:
-            self._store_analyses(results)
+            self.store_analyses(results)
         
         return results
     
-    def _store_analyses(self, analyses: List[Dict[str, Any]]):
-        """Store morphological analyses in database"""
+    def store_analyses(self, analyses: List[Dict[str, Any]]):
+        """
+        Queue morphological analyses for storage in database
+        
+        Records are buffered and written with one bulk insert once
+        FLUSH_THRESHOLD of them are pending, or when flush() is called.
+        """
         if not self.db_manager:
             return
             
-        records = []
-        
         for analysis in analyses:
             record = {
                 'word': analysis['original'],
@@ -430,8 +557,40 @@ class MorphologyAnalyzer:
                 'lemma': analysis['lemma'],
                 'pos_tag': ','.join(analysis['possible_pos']) if analysis['possible_pos'] else None
             }
-            records.append(record)
+            self._pending.append(record)
+        
+        if len(self._pending) >= self._flush_threshold:
+            self.flush()
+    
+    def flush(self) -> bool:
+        """
+        Write all buffered analyses to the database
+        
+        Returns:
+            Success status (True if nothing was pending)
+        """
+        if not self._pending or not self.db_manager:
+            return True
+        
+        records, self._pending = self._pending, []
+        if len(records) > BULK_LOAD_THRESHOLD:
+            columns = tuple(records[0])
+            stored = self.db_manager.bulk_load(
+                'word_analysis', columns, [tuple(record.values()) for record in records])
+        else:
+            stored = self.db_manager.insert_many('word_analysis', records)
+        if not stored:
+            return False
+        logger.info(f"Stored {len(records)} morphological analyses")
+        return True
+    
+    def discard_pending(self) -> int:
+        """
+        Drop all buffered analyses without writing them
         
-        if records:
-            self.db_manager.insert_many('word_analysis', records)
-            logger.info(f"Stored {len(records)} morphological analyses")
+        Returns:
+            Number of records dropped
+        """
+        dropped = len(self._pending)
+        self._pending = []
+        return dropped
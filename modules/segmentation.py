@@ -16,6 +16,23 @@ class Segmenter:
     Breaks text into sentences, words, and tokens
     """
     
+    # Sentence boundary patterns (all patterns are compiled once, for all instances)
+    sentence_endings = re.compile(r'([.!?]+[\s\'")\]]*)')
+    
+    # Words for segment_words(), and tokens for tokenize() with and
+    # without punctuation; a token_pattern match without group 1 is punctuation
+    word_pattern = re.compile(r'\b\w+\b')
+    token_pattern = re.compile(r'(\w+)|[^\w\s]')
+    word_token_pattern = re.compile(r'\w+')
+    
+    # ASCII-only twins of the above, used for ASCII text: they match the
+    # same there and skip the Unicode property lookup per character. ASCII
+    # \s leaves out the separators \x1c-\x1f that Unicode \s includes, so
+    # the punctuation class excludes them explicitly.
+    word_pattern_ascii = re.compile(word_pattern.pattern, re.ASCII)
+    token_pattern_ascii = re.compile(r'(\w+)|[^\w\s\x1c-\x1f]', re.ASCII)
+    word_token_pattern_ascii = re.compile(word_token_pattern.pattern, re.ASCII)
+    
     def __init__(self, db_manager=None):
         """
         Initialize segmenter
@@ -25,9 +42,6 @@ class Segmenter:
         """
         self.db_manager = db_manager
         
-        # Sentence boundary patterns
-        self.sentence_endings = re.compile(r'([.!?]+[\s\'")\]]*)')
-        
         # Common abbreviations that don't end sentences
         self.abbreviations = {
             'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.', 'Sr.', 'Jr.',
@@ -35,15 +49,22 @@ class Segmenter:
             'Ave.', 'St.', 'Rd.', 'Blvd.'
         }
         
-        # Punctuation patterns
-        self.punctuation = re.compile(r'[^\w\s]')
+        # Abbreviations without their final period, and the lengths they
+        # come in, so a part is checked with one set lookup per length
+        self._abbr_stems = frozenset(abbr[:-1] for abbr in self.abbreviations)
+        self._abbr_stem_lengths = tuple(sorted({len(stem) for stem in self._abbr_stems}))
+        # Last two characters of the stems: nearly every part ends in
+        # something else and is rejected with this one lookup (unless a stem
+        # is shorter than that, which turns the check off)
+        self._abbr_stem_ends = (frozenset(stem[-2:] for stem in self._abbr_stems)
+                                if min(self._abbr_stem_lengths, default=2) >= 2 else None)
         
         # Common English stopwords
-        self.stopwords = {
+        self.stopwords = frozenset({
             'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for',
             'from', 'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on',
             'that', 'the', 'to', 'was', 'will', 'with', 'the'
-        }
+        })
     
     def segment_sentences(self, text: str) -> List[str]:
         """
@@ -60,49 +81,37 @@ class Segmenter:
         if not text:
             return []
         
-        # Split by sentence boundaries
+        # Walk the sentence boundaries; the text between two of them is a
+        # part, and a sentence is emitted at every boundary that is not
+        # just the period of an abbreviation
         sentences = []
         current_sentence = []
+        stems = self._abbr_stems
+        start = 0
         
-        # Split text into potential sentences
-        parts = self.sentence_endings.split(text)
-        
-        i = 0
-        while i < len(parts):
-            part = parts[i].strip()
-            
-            if not part:
-                i += 1
-                continue
+        for match in self.sentence_endings.finditer(text):
+            part = text[start:match.start()].strip()
+            ending = match.group()
+            start = match.end()
             
-            # Check if this is a sentence ending
-            if self.sentence_endings.match(part):
-                current_sentence.append(part)
-                # Join and add sentence
-                sentence = ''.join(current_sentence).strip()
-                if sentence:
-                    sentences.append(sentence)
-                current_sentence = []
-            else:
-                # Check for abbreviations
-                if i + 1 < len(parts) and parts[i + 1].strip() in ['.', '!', '?']:
-                    # Check if current part ends with known abbreviation
-                    is_abbr = False
-                    for abbr in self.abbreviations:
-                        if part.endswith(abbr[:-1]):  # Without the period
-                            is_abbr = True
-                            break
-                    
-                    if is_abbr:
-                        current_sentence.append(part + parts[i + 1])
-                        i += 2
-                        continue
-                
+            if part:
+                # A lone '.', '!' or '?' after a known abbreviation (a part
+                # shorter than n is matched whole, as endswith would)
+                if (ending.strip() in ('.', '!', '?')
+                        and (self._abbr_stem_ends is None or part[-2:] in self._abbr_stem_ends)
+                        and any(part[-n:] in stems for n in self._abbr_stem_lengths)):
+                    current_sentence.append(part + ending)
+                    continue
                 current_sentence.append(part)
             
-            i += 1
+            current_sentence.append(ending.strip())
+            sentences.append(''.join(current_sentence).strip())
+            current_sentence = []
         
         # Add remaining sentence
+        part = text[start:].strip()
+        if part:
+            current_sentence.append(part)
         if current_sentence:
             sentence = ''.join(current_sentence).strip()
             if sentence:
@@ -121,7 +130,9 @@ class Segmenter:
             List of words
         """
         # Split by whitespace and punctuation
-        words = re.findall(r'\b\w+\b', text.lower())
+        text = text.lower()
+        pattern = self.word_pattern_ascii if text.isascii() else self.word_pattern
+        words = pattern.findall(text)
         return words
     
     def tokenize(self, text: str, preserve_punctuation: bool = True) -> List[Dict[str, Any]]:
@@ -137,19 +148,21 @@ class Segmenter:
         """
         tokens = []
         position = 0
+        stopwords = self.stopwords
         
         # Pattern to match words and punctuation separately
-        if preserve_punctuation:
-            pattern = r'\w+|[^\w\s]'
+        if text.isascii():
+            pattern = self.token_pattern_ascii if preserve_punctuation else self.word_token_pattern_ascii
         else:
-            pattern = r'\w+'
+            pattern = self.token_pattern if preserve_punctuation else self.word_token_pattern
         
-        for match in re.finditer(pattern, text):
+        for match in pattern.finditer(text):
             token_text = match.group()
             
-            # Determine token properties
-            is_punct = bool(self.punctuation.match(token_text))
-            is_stopword = token_text.lower() in self.stopwords
+            # Determine token properties; punctuation is never a stopword,
+            # so only words are lowercased
+            is_punct = preserve_punctuation and match.lastindex is None
+            is_stopword = not is_punct and token_text.lower() in stopwords
             
             token = {
                 'text': token_text,
@@ -157,7 +170,7 @@ class Segmenter:
                 'start_char': match.start(),
                 'end_char': match.end(),
                 'is_punctuation': is_punct,
-                'is_stopword': is_stopword and not is_punct
+                'is_stopword': is_stopword
             }
             
             tokens.append(token)
@@ -183,8 +196,12 @@ class Segmenter:
             'original_text': text,
             'sentence_count': len(sentences),
             'sentences': [],
-            'total_words': 0
+            'total_words': 0,
+            'total_tokens': 0,
+            'total_stopwords': 0,
+            'unique_words': 0
         }
+        unique_words = set()
         
         # Process each sentence
         for idx, sentence in enumerate(sentences):
@@ -201,6 +218,11 @@ class Segmenter:
             
             results['sentences'].append(sentence_data)
             results['total_words'] += len(words)
+            results['total_tokens'] += len(tokens)
+            results['total_stopwords'] += sum(1 for t in tokens if t['is_stopword'])
+            unique_words.update(words)
+        
+        results['unique_words'] = len(unique_words)
         
         # Store in database if requested
         if store_in_db and self.db_manager:
@@ -218,68 +240,109 @@ class Segmenter:
         Returns:
             Text segment ID or None if storage fails
         """
-        if not self.db_manager:
-            logger.warning("No database manager available, skipping storage")
-            return None
+        return self.store_batch([results])[0]
+    
+    def store_batch(self, results_list: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Store segmentation results for several texts in database
         
-        # Insert main text segment
-        text_data = {
-            'original_text': results['original_text'],
-            'sentence_count': results['sentence_count'],
-            'word_count': results['total_words']
-        }
+        Each table gets one bulk insert for all texts: the text segment
+        and sentence IDs handed back by the database become the foreign
+        keys of the sentences and tokens. (Text segments and sentences go
+        in row by row when the server may interleave AUTO_INCREMENT values,
+        see DatabaseManager.insert_many_returning_ids.)
+        
+        Args:
+            results_list: Processing results dictionaries from process_text
         
-        text_id = self.db_manager.insert_one('text_segments', text_data)
+        Returns:
+            Text segment ID (or None if storage failed) for each result
+        """
+        if not self.db_manager:
+            logger.warning("No database manager available, skipping storage")
+            return [None] * len(results_list)
         
-        if not text_id:
-            logger.error("Failed to store text segment")
-            return None
+        if not results_list:
+            return []
         
-        # Insert sentences and tokens
-        for sentence_data in results['sentences']:
-            sentence_record = {
-                'text_segment_id': text_id,
-                'sentence_text': sentence_data['text'],
-                'sentence_position': sentence_data['position'],
-                'word_count': sentence_data['word_count']
+        # Insert main text segments
+        text_records = [
+            {
+                'original_text': results['original_text'],
+                'sentence_count': results['sentence_count'],
+                'word_count': results['total_words']
             }
-            
-            sentence_id = self.db_manager.insert_one('sentences', sentence_record)
-            
-            if sentence_id:
-                # Insert tokens
-                token_records = []
-                for token in sentence_data['tokens']:
-                    token_record = {
-                        'sentence_id': sentence_id,
-                        'token': token['text'],
-                        'token_position': token['position'],
-                        'is_punctuation': token['is_punctuation'],
-                        'is_stopword': token['is_stopword']
-                    }
-                    token_records.append(token_record)
-                
-                if token_records:
-                    self.db_manager.insert_many('tokens', token_records)
-        
-        logger.info(f"Stored segmentation results with ID: {text_id}")
-        return text_id
+            for results in results_list
+        ]
+        text_ids = self.db_manager.insert_many_returning_ids('text_segments', text_records)
+        if not text_ids:
+            logger.error("Failed to store text segments")
+            return [None] * len(results_list)
+        
+        # Insert sentences of every text
+        sentence_records = []
+        sentences = []
+        for text_id, results in zip(text_ids, results_list):
+            for sentence_data in results['sentences']:
+                sentence_records.append({
+                    'text_segment_id': text_id,
+                    'sentence_text': sentence_data['text'],
+                    'sentence_position': sentence_data['position'],
+                    'word_count': sentence_data['word_count']
+                })
+                sentences.append(sentence_data)
+        
+        sentence_ids = self.db_manager.insert_many_returning_ids('sentences', sentence_records)
+        if sentence_ids is None:
+            logger.error("Failed to store sentences")
+            sentence_ids = []
+        
+        # Insert tokens of every sentence
+        token_records = []
+        for sentence_id, sentence_data in zip(sentence_ids, sentences):
+            for token in sentence_data['tokens']:
+                token_record = {
+                    'sentence_id': sentence_id,
+                    'token': token['text'],
+                    'token_position': token['position'],
+                    'is_punctuation': token['is_punctuation'],
+                    'is_stopword': token['is_stopword']
+                }
+                token_records.append(token_record)
+        
+        if token_records:
+            self.db_manager.insert_many('tokens', token_records)
+        
+        for text_id in text_ids:
+            logger.info("Stored segmentation results with ID: %s", text_id)
+        
+        return text_ids
     
     def get_statistics(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate statistics from segmentation results
         
+        Counts that process_text() keeps while segmenting are used as they
+        are; results without them are counted here.
+        
         Args:
             results: Processing results
         
         Returns:
             Statistics dictionary
         """
-        total_tokens = sum(len(s['tokens']) for s in results['sentences'])
-        total_stopwords = sum(
-            sum(1 for t in s['tokens'] if t['is_stopword'])
-            for s in results['sentences']
-        )
+        total_tokens = results.get('total_tokens')
+        total_stopwords = results.get('total_stopwords')
+        unique_words = results.get('unique_words')
+        if total_tokens is None or total_stopwords is None or unique_words is None:
+            # Count everything in one pass over the sentences
+            total_tokens = total_stopwords = 0
+            words = set()
+            for s in results['sentences']:
+                total_tokens += len(s['tokens'])
+                total_stopwords += sum(1 for t in s['tokens'] if t['is_stopword'])
+                words.update(s['words'])
+            unique_words = len(words)
         
         avg_words_per_sentence = results['total_words'] / results['sentence_count'] if results['sentence_count'] > 0 else 0
         
@@ -289,7 +352,5 @@ class Segmenter:
             'total_tokens': total_tokens,
             'total_stopwords': total_stopwords,
             'avg_words_per_sentence': round(avg_words_per_sentence, 2),
-            'unique_words': len(set(
-                word for s in results['sentences'] for word in s['words']
-            ))
+            'unique_words': unique_words
         }
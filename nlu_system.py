@@ -3,8 +3,11 @@ Natural Language Understanding System
 Main orchestrator for NLU pipeline
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Any
 from core.database import DatabaseManager
 from modules.segmentation import Segmenter
 from modules.morphology import MorphologyAnalyzer
@@ -22,6 +25,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Texts whose statistics each system keeps for get_text_statistics()
+STATISTICS_CACHE_SIZE = 256
+
 
 class NLUSystem:
     """
@@ -49,6 +55,9 @@ class NLUSystem:
         self.segmenter = Segmenter(db_manager=self.db_manager)
         self.morphology = MorphologyAnalyzer(db_manager=self.db_manager)
         
+        # Text digest -> statistics of its full analysis, least recently used first
+        self._statistics_cache: 'OrderedDict[bytes, Dict[str, Any]]' = OrderedDict()
+        
         logger.info("NLU System initialized successfully")
     
     def initialize_database(self, schema_file: str = 'database/schema.sql'):
@@ -75,7 +84,7 @@ class NLUSystem:
         Returns:
             Complete processing results
         """
-        logger.info(f"Processing text: {text[:50]}...")
+        logger.info("Processing text: %s...", text[:50])
         
         # Step 1: Segmentation
         segmentation_results = self.segmenter.process_text(text, store_in_db=store_results)
@@ -83,15 +92,9 @@ class NLUSystem:
         # Step 2: Morphological Analysis (if requested)
         morphology_results = []
         if analyze_morphology:
-            # Collect all words from all sentences
-            all_words = []
-            for sentence in segmentation_results['sentences']:
-                all_words.extend(sentence['words'])
-            
             # Analyze unique words
-            unique_words = list(set(all_words))
             morphology_results = self.morphology.analyze_batch(
-                unique_words, 
+                self._unique_words(segmentation_results), 
                 store_in_db=store_results
             )
         
@@ -102,10 +105,85 @@ class NLUSystem:
             'morphology': morphology_results,
             'statistics': self._compile_statistics(segmentation_results, morphology_results)
         }
+        if analyze_morphology:
+            self._remember_statistics(text, results['statistics'])
         
         logger.info("Text processing completed")
         return results
     
+    def process_texts(self, texts: List[str], analyze_morphology: bool = True,
+                      store_results: bool = True,
+                      batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Complete text processing pipeline for several texts
+        
+        Gives the same results and stored rows as process_text() on each
+        text, but works a batch at a time: the batch's tokens and word
+        analyses are stored with one bulk insert each. Every text gets its
+        own analysis dicts; words repeated across texts are served from the
+        analyzer's memoized analyses.
+        
+        Args:
+            texts: Input texts
+            analyze_morphology: Whether to perform morphological analysis
+            store_results: Whether to store results in database
+            batch_size: Texts per batch (default: all texts in one batch)
+        
+        Returns:
+            Complete processing results for each text, in input order
+        
+        Raises:
+            ValueError: If batch_size is given and less than 1
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        batch_size = batch_size or len(texts) or 1
+        all_results = []
+        
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            logger.info("Processing batch of %d texts...", len(batch))
+            
+            # Step 1: Segmentation, stored for the whole batch at once
+            segmentations = [self.segmenter.process_text(text, store_in_db=False) for text in batch]
+            if store_results:
+                self.segmenter.store_batch(segmentations)
+            
+            # Step 2: Morphological Analysis (if requested)
+            morphologies: List[List[Dict[str, Any]]] = [[] for _ in batch]
+            if analyze_morphology:
+                morphologies = [
+                    self.morphology.analyze_batch(self._unique_words(segmentation), store_in_db=False)
+                    for segmentation in segmentations
+                ]
+                
+                if store_results:
+                    self.morphology.store_analyses(
+                        [analysis for morphology in morphologies for analysis in morphology]
+                    )
+            
+            for text, segmentation, morphology in zip(batch, segmentations, morphologies):
+                results = {
+                    'text': text,
+                    'segmentation': segmentation,
+                    'morphology': morphology,
+                    'statistics': self._compile_statistics(segmentation, morphology)
+                }
+                if analyze_morphology:
+                    self._remember_statistics(text, results['statistics'])
+                all_results.append(results)
+        
+        logger.info("Processed %d texts", len(all_results))
+        return all_results
+    
+    @staticmethod
+    def _unique_words(segmentation: Dict[str, Any]) -> List[str]:
+        """Collect the distinct words from all sentences of a segmentation result"""
+        unique_words = set()
+        for sentence in segmentation['sentences']:
+            unique_words.update(sentence['words'])
+        return list(unique_words)
+    
     def analyze_sentence(self, sentence: str) -> Dict[str, Any]:
         """
         Analyze a single sentence
@@ -157,8 +235,9 @@ class NLUSystem:
         # Segment into words
         words = self.segmenter.segment_words(text)
         
-        # Lemmatize each word
-        lemmas = [self.morphology.lemmatize(word) for word in words]
+        # Lemmatize each distinct word once
+        lemma_of = {word: self.morphology.lemmatize(word) for word in set(words)}
+        lemmas = [lemma_of[word] for word in words]
         
         return ' '.join(lemmas)
     
@@ -166,15 +245,37 @@ class NLUSystem:
         """
         Get comprehensive statistics about text
         
+        Statistics of texts recently analyzed with morphology (here or in
+        process_text()) are returned without running the pipeline again.
+        
         Args:
             text: Input text
         
         Returns:
             Statistics dictionary
         """
+        key = self._text_key(text)
+        cached = self._statistics_cache.get(key)
+        if cached is not None:
+            self._statistics_cache.move_to_end(key)
+            return dict(cached)
+        
         results = self.process_text(text, analyze_morphology=True, store_results=False)
         return results['statistics']
     
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Fixed-size key for a text, so the cache doesn't hold the texts themselves"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def _remember_statistics(self, text: str, statistics: Dict[str, Any]):
+        """Keep a copy of a text's full-analysis statistics for get_text_statistics()"""
+        key = self._text_key(text)
+        self._statistics_cache[key] = dict(statistics)
+        self._statistics_cache.move_to_end(key)
+        if len(self._statistics_cache) > STATISTICS_CACHE_SIZE:
+            self._statistics_cache.popitem(last=False)
+    
     def _compile_statistics(self, segmentation: Dict[str, Any], 
                            morphology: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -226,9 +327,11 @@ class NLUSystem:
         
         morpheme_id = self.db_manager.insert_one('morphemes', data)
         if morpheme_id:
-            logger.info(f"Added morpheme: {morpheme} ({morpheme_type})")
-            # Reload morphemes
-            self.morphology._load_morphemes()
+            logger.info("Added morpheme: %s (%s)", morpheme, morpheme_type)
+            # Reload morphemes, bypassing the shared cache; statistics
+            # computed with the old dictionaries are stale now
+            self.morphology._load_morphemes(refresh=True)
+            self._statistics_cache.clear()
         return morpheme_id
     
     def search_word_analyses(self, word: str) -> List[Dict[str, Any]]:
@@ -241,6 +344,7 @@ class NLUSystem:
         Returns:
             List of previous analyses
         """
+        self.flush()
         query = "SELECT * FROM word_analysis WHERE word = %s"
         return self.db_manager.fetch_all(query, (word,))
     
@@ -254,16 +358,70 @@ class NLUSystem:
         Returns:
             List of text segments
         """
-        query = f"""
+        query = """
+        SELECT id, original_text, sentence_count, word_count, processed_at 
+        FROM text_segments 
+        ORDER BY processed_at DESC 
+        LIMIT %s
+        """
+        return self.db_manager.fetch_all(query, (int(limit),))
+    
+    def iter_recent_texts(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over processed texts, newest first, without loading them all
+        
+        Rows are streamed from the server in chunks, so memory stays flat
+        however many texts there are. Database errors are raised rather
+        than logged, since they can occur part way through.
+        
+        Args:
+            limit: Maximum number of texts (default: all)
+        
+        Yields:
+            Text segments
+        """
+        query = """
         SELECT id, original_text, sentence_count, word_count, processed_at 
         FROM text_segments 
         ORDER BY processed_at DESC 
-        LIMIT {limit}
         """
-        return self.db_manager.fetch_all(query)
+        params: tuple = ()
+        if limit is not None:
+            query += "LIMIT %s"
+            params = (int(limit),)
+        yield from self.db_manager.iter_all(query, params)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Store everything written inside the block in one database transaction
+        
+        Word analyses buffered in the block are written before the commit;
+        if the block raises, they are dropped along with the rollback.
+        
+        Usage:
+            with nlu.transaction():
+                nlu.process_text(text, store_results=True)
+        """
+        # Analyses buffered before the block don't belong to it
+        self.morphology.flush()
+        with self.db_manager.transaction():
+            try:
+                yield
+                self.morphology.flush()
+            except BaseException:
+                dropped = self.morphology.discard_pending()
+                if dropped:
+                    logger.info("Discarded %d buffered analyses of a rolled-back transaction", dropped)
+                raise
+    
+    def flush(self):
+        """Write buffered word analyses to the database"""
+        self.morphology.flush()
     
     def close(self):
         """Close database connection and cleanup"""
+        self.flush()
         self.db_manager.disconnect()
         logger.info("NLU System closed")
     